@@ -4,6 +4,13 @@ Find VISA Instruments
 This script lists all available VISA instruments connected to the system.
 Supports USB, TCPIP (Ethernet), and other VISA interfaces.
 
+By default only USB and TCPIP instruments are listed, which skips probing
+every serial port with *IDN?. Use --interface to choose:
+
+    python GENERAL_all_find-instruments.py                   # USB + TCPIP
+    python GENERAL_all_find-instruments.py --interface usb   # USB only
+    python GENERAL_all_find-instruments.py --interface all   # every interface
+
 For USB devices to be detected with pyvisa-py, you need:
 1. pyusb package: pip install pyusb
 2. USB backend: pip install libusb-package (or install libusb manually)
@@ -13,32 +20,107 @@ For USB devices to be detected with pyvisa-py, you need:
 
 import pyvisa
 import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# VISA resource name prefix for each --interface choice
+INTERFACE_PREFIXES = {
+    'usb': 'USB',
+    'tcpip': 'TCPIP',
+    'asrl': 'ASRL',
+    'gpib': 'GPIB',
+}
+DEFAULT_INTERFACES = ['usb', 'tcpip']
+
+# *IDN? timeout (ms) by resource prefix; slow/absent devices are probed in parallel
+IDN_TIMEOUTS = {
+    'USB': 500,
+    'TCPIP': 1500,
+}
+DEFAULT_IDN_TIMEOUT = 2000
+MAX_PROBE_WORKERS = 16
+
+
+def _probe(rm, resource):
+    """
+    Open a resource, query *IDN? and close it.
+
+    Args:
+        rm: PyVISA ResourceManager
+        resource: VISA resource string
+
+    Returns:
+        Tuple of (resource, idn, error) where one of idn/error is None
+    """
+    timeout = DEFAULT_IDN_TIMEOUT
+    for prefix, prefix_timeout in IDN_TIMEOUTS.items():
+        if resource.upper().startswith(prefix):
+            timeout = prefix_timeout
+            break
+
+    try:
+        inst = rm.open_resource(resource)
+        try:
+            inst.timeout = timeout
+            return (resource, inst.query("*IDN?").strip(), None)
+        finally:
+            inst.close()
+    except Exception as e:
+        return (resource, None, e)
+
+
+def build_resource_query(interfaces):
+    """
+    Build a VISA resource query for the selected interfaces.
+
+    Args:
+        interfaces: List of interface names (see INTERFACE_PREFIXES) or ['all']
+
+    Returns:
+        VISA resource expression, e.g. '(USB|TCPIP)?*::INSTR'
+    """
+    if 'all' in interfaces:
+        return '?*::INSTR'
+    prefixes = [INTERFACE_PREFIXES[name] for name in interfaces]
+    if len(prefixes) == 1:
+        return f"{prefixes[0]}?*::INSTR"
+    return f"({'|'.join(prefixes)})?*::INSTR"
+
+
+def find_instruments(interfaces=None):
+    """
+    Find and list available VISA instruments.
+
+    Args:
+        interfaces: Interfaces to search (default: USB and TCPIP)
+    """
+    if interfaces is None:
+        interfaces = DEFAULT_INTERFACES
+    query = build_resource_query(interfaces)
 
-def find_instruments():
-    """Find and list all available VISA instruments."""
     print("="*60)
     print("VISA Instrument Finder")
     print("="*60)
 
     # Try pyvisa-py backend first
     print("\nUsing PyVISA-py backend (@py)...")
+    print(f"Resource filter: {query}")
     try:
         rm = pyvisa.ResourceManager('@py')
-        resources = rm.list_resources()
+        resources = rm.list_resources(query)
 
         if resources:
             print(f"\nFound {len(resources)} instrument(s):\n")
-            for i, resource in enumerate(resources, 1):
-                print(f"  {i}. {resource}")
-                # Try to get instrument ID
-                try:
-                    inst = rm.open_resource(resource)
-                    inst.timeout = 2000
-                    idn = inst.query("*IDN?").strip()
-                    print(f"     ID: {idn}")
-                    inst.close()
-                except Exception as e:
-                    print(f"     (Could not query ID: {e})")
+            # Query all instruments concurrently, results come back in order
+            workers = min(MAX_PROBE_WORKERS, len(resources))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda r: _probe(rm, r), resources)
+                for i, (resource, idn, error) in enumerate(results, 1):
+                    print(f"  {i}. {resource}")
+                    if error is None:
+                        print(f"     ID: {idn}")
+                    else:
+                        print(f"     (Could not query ID: {error})")
         else:
             print("\nNo instruments found.")
             print("\nTroubleshooting for USB devices:")
@@ -83,5 +165,15 @@ def find_instruments():
 
     print("\n" + "="*60)
 
+def main():
+    parser = argparse.ArgumentParser(description='Find VISA instruments')
+    parser.add_argument('--interface', nargs='+', default=DEFAULT_INTERFACES,
+                       choices=[*INTERFACE_PREFIXES, 'all'],
+                       help='Interfaces to search (default: usb tcpip)')
+    args = parser.parse_args()
+
+    find_instruments(args.interface)
+
+
 if __name__ == "__main__":
-    find_instruments()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 General Purpose Result Plotter
 
-This script reads Excel result files and plots measurements with:
+This script reads result files (CSV or Excel) and plots measurements with:
 - X-axis: Elapsed Time (hr)
 - Y-axis: Measurement values (Vrms, Temperature, etc.)
 
@@ -9,7 +9,7 @@ Supports dual y-axes for measurements with different scales.
 
 Usage:
     # Plot all measurements from a file
-    python GENERAL_all_plot-results.py results/Result_20251118_150710_Real-Time-Result_FINAL.xlsx
+    python GENERAL_all_plot-results.py results/Result_20251118_150710_FINAL.csv
 
     # Plot specific columns
     python GENERAL_all_plot-results.py results/file.xlsx --columns "Vrms CH1 (V)" "Temperature (C)"
@@ -29,44 +29,355 @@ Usage:
     # Enable minor grid lines
     python GENERAL_all_plot-results.py results/file.xlsx --grid-minor
 
+    # Plot all matching files to PNG in one run
+    python GENERAL_all_plot-results.py --batch "results/*_FINAL.csv"
+
 Requirements:
     pip install matplotlib pandas openpyxl
+
+    Optional (roughly 2x faster Excel loading, needs pandas >= 2.2):
+    pip install python-calamine
+
+    Optional (caches parsed files as <file>.parquet for fast re-plots):
+    pip install pyarrow
+
+    Optional (MinMax-LTTB downsampling for very long logs):
+    pip install tsdownsample
+
+    Optional (single-pass compiled min/max for axis scaling):
+    pip install numba
+
+    Optional (Polars/Arrow reader, used by --engine auto when installed):
+    pip install polars fastexcel
 """
 
 import sys
 import os
+import csv
+import glob
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.ticker import AutoMinorLocator, MultipleLocator
 import argparse
+import itertools
+import openpyxl
+
+# Prefer the Rust-based calamine reader; fall back to openpyxl if not installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Polars reader with calamine backend (optional)
+try:
+    import polars as pl
+    import fastexcel  # noqa: F401
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+READ_ENGINES = ['auto', 'pandas', 'polars']
+
+# Non-measurement columns written by every logger
+EXCLUDE_COLUMNS = frozenset({'Timestamp', 'Elapsed Time (ms)', 'Elapsed Time (hr)'})
+
+# Line colors, cycled when there are more columns than colors
+COLORS = plt.cm.tab10.colors
+
+# Parquet sidecar cache (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+CACHE_SUFFIX = ".parquet"
+CACHE_KEY = b"source_key"
+
+# Downsampling for very long series (optional)
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+    DOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    DOWNSAMPLE_AVAILABLE = False
+
+DOWNSAMPLE_THRESHOLD = 100_000  # Points above which a series is downsampled
+DOWNSAMPLE_POINTS = 4000        # Target points per series (~screen resolution)
+
+# Compiled single-pass min/max (optional)
+try:
+    import numba
+
+    @numba.njit(cache=True)
+    def _nan_min_max(arr):
+        """Return (min, max) of a 1-D array in one pass, skipping NaN."""
+        lo = np.nan
+        hi = np.nan
+        for i in range(arr.size):
+            v = arr[i]
+            if v != v:  # NaN
+                continue
+            if not (lo <= v):
+                lo = v
+            if not (hi >= v):
+                hi = v
+        return lo, hi
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Let Agg merge vertices that land on the same pixel and render long paths in chunks
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 
 
 def list_result_files(results_dir: str = "results") -> list:
-    """List all Excel result files in the results directory."""
+    """List all CSV and Excel result files in the results directory."""
     results_path = Path(results_dir)
     if not results_path.exists():
         print(f"Results directory not found: {results_dir}")
         return []
 
-    files = sorted(results_path.glob("*.xlsx"))
+    files = sorted([*results_path.glob("*.csv"), *results_path.glob("*.xlsx")])
     return files
 
 
-def read_result_file(filepath: str) -> pd.DataFrame:
+def _cache_key(filepath: str) -> bytes:
+    """Build cache key from source file path, mtime and size."""
+    stat = os.stat(filepath)
+    return f"{os.path.abspath(filepath)}|{stat.st_mtime_ns}|{stat.st_size}".encode()
+
+
+def _cache_is_valid(filepath: str) -> bool:
+    """Check whether the parquet sidecar exists and matches the source file."""
+    cache_path = filepath + CACHE_SUFFIX
+    if not os.path.exists(cache_path):
+        return False
+
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except Exception:
+        return False
+    return metadata.get(CACHE_KEY) == _cache_key(filepath)
+
+
+def _load_cached(filepath: str, usecols: list = None):
+    """Return cached DataFrame if the sidecar matches the source file, else None."""
+    if not _cache_is_valid(filepath):
+        return None
+
+    cache_path = filepath + CACHE_SUFFIX
+    try:
+        schema = pq.read_schema(cache_path)
+        columns = None
+        if usecols is not None:
+            columns = [col for col in schema.names if col in usecols]
+        return pq.read_table(cache_path, columns=columns).to_pandas()
+    except Exception:
+        # Corrupt or incompatible cache, re-read the source file
+        return None
+
+
+def _save_cached(filepath: str, df: pd.DataFrame):
+    """Write DataFrame to the parquet sidecar (errors are ignored)."""
+    cache_path = filepath + CACHE_SUFFIX
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[CACHE_KEY] = _cache_key(filepath)
+        table = table.replace_schema_metadata(metadata)
+        pq.write_table(table, cache_path, compression="zstd")
+    except Exception as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+
+
+def _read_excel(filepath: str, usecols: list = None, nrows: int = None,
+                engine: str = 'auto') -> pd.DataFrame:
     """
-    Read Excel result file into a DataFrame.
+    Parse an Excel file with pandas or Polars.
 
     Args:
         filepath: Path to the Excel file
+        usecols: Column names to load (None for all), missing names ignored
+        nrows: Number of data rows to load (None for all)
+        engine: 'pandas', 'polars', or 'auto' (Polars if installed)
+
+    Returns:
+        DataFrame with the selected data
+    """
+    if engine == 'auto':
+        engine = 'polars' if POLARS_AVAILABLE else 'pandas'
+
+    if engine == 'polars':
+        if not POLARS_AVAILABLE:
+            raise ImportError("Polars engine requires: pip install polars fastexcel")
+
+        read_options = {} if nrows is None else {'n_rows': nrows}
+        columns = None
+        if usecols is not None:
+            # Select only names that exist, Polars raises on unknown columns
+            header = pl.read_excel(filepath, engine='calamine',
+                                   read_options={'n_rows': 0}).columns
+            columns = [col for col in header if col in usecols]
+            if not columns:
+                return pd.DataFrame()
+        return pl.read_excel(filepath, engine='calamine', columns=columns,
+                             read_options=read_options).to_pandas()
+
+    columns_filter = None
+    if usecols is not None:
+        wanted = set(usecols)
+        columns_filter = lambda col: col in wanted
+    return pd.read_excel(filepath, engine=EXCEL_ENGINE, usecols=columns_filter,
+                         nrows=nrows)
+
+
+def _read_csv(filepath: str, usecols: list = None, nrows: int = None,
+              engine: str = 'auto') -> pd.DataFrame:
+    """
+    Parse a CSV result file (as written by the loggers) with pandas or Polars.
+
+    Args:
+        filepath: Path to the CSV file
+        usecols: Column names to load (None for all), missing names ignored
+        nrows: Number of data rows to load (None for all)
+        engine: 'pandas', 'polars', or 'auto' (Polars if installed)
+
+    Returns:
+        DataFrame with the selected data
+    """
+    if engine == 'auto':
+        engine = 'polars' if POLARS_AVAILABLE else 'pandas'
+
+    if engine == 'polars':
+        if not POLARS_AVAILABLE:
+            raise ImportError("Polars engine requires: pip install polars")
+
+        columns = None
+        if usecols is not None:
+            header = pl.read_csv(filepath, n_rows=0).columns
+            columns = [col for col in header if col in usecols]
+            if not columns:
+                return pd.DataFrame()
+        # A live file may end in a partially written row
+        return pl.read_csv(filepath, columns=columns, n_rows=nrows,
+                           truncate_ragged_lines=True).to_pandas()
+
+    columns_filter = None
+    if usecols is not None:
+        wanted = set(usecols)
+        columns_filter = lambda col: col in wanted
+    return pd.read_csv(filepath, encoding='utf-8-sig', usecols=columns_filter,
+                       nrows=nrows)
+
+
+def _read_source(filepath: str, usecols: list = None, nrows: int = None,
+                 engine: str = 'auto') -> pd.DataFrame:
+    """Parse a result file with the CSV or Excel reader, chosen by extension."""
+    if filepath.lower().endswith('.csv'):
+        return _read_csv(filepath, usecols=usecols, nrows=nrows, engine=engine)
+    return _read_excel(filepath, usecols=usecols, nrows=nrows, engine=engine)
+
+
+def read_result_file(filepath: str, use_cache: bool = True, usecols: list = None,
+                     nrows: int = None, engine: str = 'auto') -> pd.DataFrame:
+    """
+    Read a CSV or Excel result file into a DataFrame.
+
+    CSV files are parsed with pandas or Polars read_csv. For Excel files,
+    the pandas engine uses calamine when python-calamine is installed,
+    otherwise openpyxl. The Polars engine always uses calamine and builds
+    Arrow columns before converting to pandas. Only cell values are needed,
+    so no features are lost.
+
+    When pyarrow is installed, the parsed data is cached next to the source
+    as <file>.parquet (e.g. Result_..._FINAL.csv.parquet). The cache is
+    invalidated when the source file's path, modification time or size
+    changes.
+
+    Args:
+        filepath: Path to the CSV or Excel file
+        use_cache: Read/write the parquet sidecar cache if available
+        usecols: Column names to load (None for all). Names not present in
+                 the file are ignored.
+        nrows: Number of data rows to load (None for all, 0 for header only)
+        engine: File reader: 'pandas', 'polars', or 'auto' (default)
 
     Returns:
         DataFrame with measurement data
     """
-    df = pd.read_excel(filepath)
+    use_cache = use_cache and PARQUET_AVAILABLE
+
+    if use_cache:
+        df = _load_cached(filepath, usecols)
+        if df is None:
+            # Cache miss: parse the full file once so the cache can serve any later subset
+            df = _read_source(filepath, engine=engine)
+            _save_cached(filepath, df)
+            if usecols is not None:
+                df = df[[col for col in df.columns if col in usecols]]
+        if nrows is not None:
+            df = df.head(nrows)
+    else:
+        df = _read_source(filepath, usecols=usecols, nrows=nrows, engine=engine)
+
+    return downcast_measurements(df)
+
+
+def downcast_measurements(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert float64 measurement columns to float32.
+
+    Instrument readings never need more than float32 precision, and the
+    smaller dtype halves memory traffic for min/max and plotting. Elapsed
+    time columns stay float64 to keep timing resolution on long runs.
+
+    Args:
+        df: DataFrame with result data
+
+    Returns:
+        The same DataFrame with measurement columns downcast
+    """
+    float_cols = [col for col in df.select_dtypes('float64').columns
+                  if col not in ('Elapsed Time (ms)', 'Elapsed Time (hr)')]
+    if float_cols:
+        df[float_cols] = df[float_cols].astype(np.float32)
     return df
 
 
+def downsample_series(x_data, y_data):
+    """
+    Reduce a long series to about DOWNSAMPLE_POINTS points for plotting.
+
+    Uses MinMax-LTTB from tsdownsample, which keeps peaks and the visual
+    shape of the trace. Series shorter than DOWNSAMPLE_THRESHOLD, series
+    containing NaN, or a missing tsdownsample are returned unchanged.
+
+    Args:
+        x_data: X values (must be increasing)
+        y_data: Y values
+
+    Returns:
+        Tuple of (x, y) arrays
+    """
+    x = np.asarray(x_data)
+    y = np.asarray(y_data)
+
+    if not DOWNSAMPLE_AVAILABLE or len(y) <= DOWNSAMPLE_THRESHOLD:
+        return x, y
+    if np.isnan(x).any() or np.isnan(y).any():
+        return x, y
+
+    indices = MinMaxLTTBDownsampler().downsample(x, y, n_out=DOWNSAMPLE_POINTS)
+    return x[indices], y[indices]
+
+
 def get_measurement_columns(df: pd.DataFrame) -> list:
     """
     Get list of measurement columns (excluding Timestamp and Elapsed Time).
@@ -77,8 +388,28 @@ def get_measurement_columns(df: pd.DataFrame) -> list:
     Returns:
         List of measurement column names
     """
-    exclude = ['Timestamp', 'Elapsed Time (ms)', 'Elapsed Time (hr)']
-    return [col for col in df.columns if col not in exclude]
+    return list(df.columns.difference(EXCLUDE_COLUMNS, sort=False))
+
+
+def column_min_max(data) -> tuple:
+    """
+    Get (min, max) of a Series, DataFrame or array, ignoring NaN values.
+
+    Args:
+        data: Series, DataFrame, or 1-D/2-D array of values
+
+    Returns:
+        Tuple of (min, max)
+    """
+    arr = np.asarray(data)
+    if arr.dtype not in (np.float32, np.float64):
+        arr = arr.astype(np.float64)
+
+    if NUMBA_AVAILABLE:
+        lo, hi = _nan_min_max(np.ascontiguousarray(arr).ravel())
+        return (float(lo), float(hi))
+
+    return (np.nanmin(arr), np.nanmax(arr))
 
 
 def calculate_axis_limits(data, headroom_percent: float = 10):
@@ -92,8 +423,23 @@ def calculate_axis_limits(data, headroom_percent: float = 10):
     Returns:
         Tuple of (min_limit, max_limit)
     """
-    data_min = data.min()
-    data_max = data.max()
+    data_min, data_max = column_min_max(data)
+    return calculate_axis_limits_from_minmax(data_min, data_max, headroom_percent)
+
+
+def calculate_axis_limits_from_minmax(data_min: float, data_max: float,
+                                      headroom_percent: float = 10):
+    """
+    Calculate axis limits with headroom from a precomputed min and max.
+
+    Args:
+        data_min: Minimum data value
+        data_max: Maximum data value
+        headroom_percent: Percentage of headroom to add (default 10%)
+
+    Returns:
+        Tuple of (min_limit, max_limit)
+    """
     data_range = data_max - data_min
 
     # Handle case where all values are the same
@@ -105,10 +451,43 @@ def calculate_axis_limits(data, headroom_percent: float = 10):
     return (data_min - headroom, data_max + headroom)
 
 
+# Figures kept alive between calls when reuse_figure=True, keyed by axes count
+_FIG_CACHE = {}
+
+
+def get_or_create_figure(n_axes: int, figsize: tuple):
+    """
+    Get a cleared cached figure with n_axes stacked axes, creating it if needed.
+
+    Reusing a figure skips figure/canvas construction when plotting many
+    files in one process. The figure is made current so plt.* calls apply.
+
+    Args:
+        n_axes: Number of vertically stacked axes
+        figsize: Figure size in inches (width, height)
+
+    Returns:
+        Tuple of (figure, axes) where axes is a single Axes if n_axes == 1
+    """
+    fig = _FIG_CACHE.get(n_axes)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=figsize)
+        _FIG_CACHE[n_axes] = fig
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+        plt.figure(fig.number)
+
+    if n_axes == 1:
+        return fig, fig.subplots()
+    return fig, fig.subplots(n_axes, 1, sharex=True)
+
+
 def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False,
                 title: str = None, save_path: str = None, ylabel_left: str = None,
                 ylabel_right: str = None, grid_x: float = None, grid_y_left: float = None,
-                grid_y_right: float = None, grid_minor: bool = False):
+                grid_y_right: float = None, grid_minor: bool = False,
+                reuse_figure: bool = False):
     """
     Plot measurement results.
 
@@ -124,13 +503,15 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
         grid_y_left: Major grid interval for left/main y-axis (None for auto)
         grid_y_right: Major grid interval for right y-axis (None for auto, dual-axis only)
         grid_minor: Show minor grid lines
+        reuse_figure: Draw into a cached figure and keep it open (for batch use)
     """
     # Get elapsed time column
     if 'Elapsed Time (hr)' not in df.columns:
         print("Error: 'Elapsed Time (hr)' column not found")
         return
 
-    x_data = df['Elapsed Time (hr)']
+    # Convert once and share across all plot calls
+    x_data = df['Elapsed Time (hr)'].to_numpy(dtype=np.float64)
 
     # Get measurement columns
     all_measurements = get_measurement_columns(df)
@@ -149,23 +530,23 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
         plot_columns = all_measurements
 
     # Create figure
-    fig, ax1 = plt.subplots(figsize=(12, 6))
-
-    # Color cycle
-    colors = plt.cm.tab10.colors
+    if reuse_figure:
+        fig, ax1 = get_or_create_figure(1, (12, 6))
+    else:
+        fig, ax1 = plt.subplots(figsize=(12, 6))
 
     if dual_axis and len(plot_columns) >= 2:
         # Dual y-axis mode: first column on left, rest on right
         # Plot first column on left axis
         col1 = plot_columns[0]
-        line1 = ax1.plot(x_data, df[col1], color=colors[0], linewidth=1,
+        line1 = ax1.plot(*downsample_series(x_data, df[col1].to_numpy()), color=COLORS[0], linewidth=1,
                         label=col1, marker='', linestyle='-')
         ax1.set_xlabel('Elapsed Time (hr)', fontsize=12)
 
         # Use custom label if provided, otherwise use column name
         left_label = ylabel_left if ylabel_left else col1
-        ax1.set_ylabel(left_label, color=colors[0], fontsize=12)
-        ax1.tick_params(axis='y', labelcolor=colors[0])
+        ax1.set_ylabel(left_label, color=COLORS[0], fontsize=12)
+        ax1.tick_params(axis='y', labelcolor=COLORS[0])
 
         # Scale left y-axis to data range with headroom
         y1_min, y1_max = calculate_axis_limits(df[col1])
@@ -176,16 +557,17 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
 
         # Plot remaining columns on right axis
         lines = line1
-        for i, col in enumerate(plot_columns[1:], 1):
-            line = ax2.plot(x_data, df[col], color=colors[i % len(colors)],
+        right_colors = itertools.islice(itertools.cycle(COLORS), 1, None)
+        for col, color in zip(plot_columns[1:], right_colors):
+            line = ax2.plot(*downsample_series(x_data, df[col].to_numpy()), color=color,
                            linewidth=1, label=col, marker='', linestyle='-')
             lines += line
 
         if len(plot_columns) == 2:
             # Use custom label if provided, otherwise use column name
             right_label = ylabel_right if ylabel_right else plot_columns[1]
-            ax2.set_ylabel(right_label, color=colors[1], fontsize=12)
-            ax2.tick_params(axis='y', labelcolor=colors[1])
+            ax2.set_ylabel(right_label, color=COLORS[1], fontsize=12)
+            ax2.tick_params(axis='y', labelcolor=COLORS[1])
 
             # Scale right y-axis to data range with headroom
             y2_min, y2_max = calculate_axis_limits(df[plot_columns[1]])
@@ -195,9 +577,10 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
             right_label = ylabel_right if ylabel_right else 'Other Measurements'
             ax2.set_ylabel(right_label, fontsize=12)
 
-            # For multiple columns on right axis, find overall min/max
-            all_right_data = pd.concat([df[col] for col in plot_columns[1:]])
-            y2_min, y2_max = calculate_axis_limits(all_right_data)
+            # For multiple columns on right axis, reduce over one 2D block
+            # (no copy when the columns share a float dtype)
+            right_data = df[plot_columns[1:]].to_numpy(copy=False)
+            y2_min, y2_max = calculate_axis_limits_from_minmax(*column_min_max(right_data))
             ax2.set_ylim(y2_min, y2_max)
 
         # Combined legend
@@ -214,8 +597,8 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
 
     else:
         # Single y-axis mode: all columns on same axis
-        for i, col in enumerate(plot_columns):
-            ax1.plot(x_data, df[col], color=colors[i % len(colors)],
+        for col, color in zip(plot_columns, itertools.cycle(COLORS)):
+            ax1.plot(*downsample_series(x_data, df[col].to_numpy()), color=color,
                     linewidth=1, label=col, marker='', linestyle='-')
 
         ax1.set_xlabel('Elapsed Time (hr)', fontsize=12)
@@ -279,11 +662,12 @@ def plot_results(df: pd.DataFrame, columns: list = None, dual_axis: bool = False
     else:
         plt.show()
 
-    plt.close()
+    if not reuse_figure:
+        plt.close()
 
 
 def plot_subplots(df: pd.DataFrame, columns: list = None, title: str = None,
-                 save_path: str = None):
+                 save_path: str = None, reuse_figure: bool = False):
     """
     Plot each measurement in separate subplots.
 
@@ -292,12 +676,14 @@ def plot_subplots(df: pd.DataFrame, columns: list = None, title: str = None,
         columns: List of columns to plot (None for all measurements)
         title: Plot title
         save_path: Path to save the plot image
+        reuse_figure: Draw into a cached figure and keep it open (for batch use)
     """
     if 'Elapsed Time (hr)' not in df.columns:
         print("Error: 'Elapsed Time (hr)' column not found")
         return
 
-    x_data = df['Elapsed Time (hr)']
+    # Convert once and share across all plot calls
+    x_data = df['Elapsed Time (hr)'].to_numpy(dtype=np.float64)
 
     # Get measurement columns
     all_measurements = get_measurement_columns(df)
@@ -312,16 +698,16 @@ def plot_subplots(df: pd.DataFrame, columns: list = None, title: str = None,
 
     # Create subplots
     n_plots = len(plot_columns)
-    fig, axes = plt.subplots(n_plots, 1, figsize=(12, 3 * n_plots), sharex=True)
+    if reuse_figure:
+        fig, axes = get_or_create_figure(n_plots, (12, 3 * n_plots))
+    else:
+        fig, axes = plt.subplots(n_plots, 1, figsize=(12, 3 * n_plots), sharex=True)
 
     if n_plots == 1:
         axes = [axes]
 
-    colors = plt.cm.tab10.colors
-
-    for i, col in enumerate(plot_columns):
-        ax = axes[i]
-        ax.plot(x_data, df[col], color=colors[i % len(colors)],
+    for ax, col, color in zip(axes, plot_columns, itertools.cycle(COLORS)):
+        ax.plot(*downsample_series(x_data, df[col].to_numpy()), color=color,
                linewidth=1, marker='', linestyle='-')
         ax.set_ylabel(col, fontsize=10)
         ax.grid(True, alpha=0.3)
@@ -346,31 +732,207 @@ def plot_subplots(df: pd.DataFrame, columns: list = None, title: str = None,
     else:
         plt.show()
 
-    plt.close()
+    if not reuse_figure:
+        plt.close()
+
+
+def scan_file_info(filepath: str) -> tuple:
+    """
+    Stream a CSV or Excel result file to get its shape and time range.
+
+    Reads CSV files with the csv module and workbooks in openpyxl read-only
+    mode, walking the rows once and keeping only a row count and a running
+    min/max of the elapsed time. Memory use does not grow with file size.
+
+    Args:
+        filepath: Path to the CSV or Excel file
+
+    Returns:
+        Tuple of (columns, row_count, (elapsed_min, elapsed_max) or None)
+    """
+    if filepath.lower().endswith('.csv'):
+        with open(filepath, newline='', encoding='utf-8-sig') as f:
+            return _scan_rows(csv.reader(f), numeric_text=True)
+
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        return _scan_rows(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def _scan_rows(rows, numeric_text: bool = False) -> tuple:
+    """Count rows and track the elapsed time range for scan_file_info."""
+    columns = [col for col in next(rows) if col is not None]
+
+    elapsed_idx = None
+    if 'Elapsed Time (hr)' in columns:
+        elapsed_idx = columns.index('Elapsed Time (hr)')
+
+    row_count = 0
+    elapsed_min = elapsed_max = None
+    for row in rows:
+        if all(value is None or value == '' for value in row):
+            continue
+        row_count += 1
+        if elapsed_idx is None or elapsed_idx >= len(row):
+            continue
+        value = row[elapsed_idx]
+        if numeric_text:
+            # CSV cells are text; a partially written last row may be empty
+            try:
+                value = float(value)
+            except ValueError:
+                continue
+        if isinstance(value, (int, float)):
+            if elapsed_min is None or value < elapsed_min:
+                elapsed_min = value
+            if elapsed_max is None or value > elapsed_max:
+                elapsed_max = value
+
+    elapsed_range = None if elapsed_min is None else (elapsed_min, elapsed_max)
+    return columns, row_count, elapsed_range
+
+
+def read_file_info(filepath: str, use_cache: bool = True, engine: str = 'auto') -> tuple:
+    """
+    Get shape and time range of a result file through read_result_file.
+
+    Args:
+        filepath: Path to the CSV or Excel file
+        use_cache: Read/write the parquet sidecar cache if available
+        engine: File reader passed to read_result_file
+
+    Returns:
+        Tuple of (columns, row_count, (elapsed_min, elapsed_max) or None)
+    """
+    # Header only, then just the elapsed time column for row count and range
+    header = read_result_file(filepath, use_cache=use_cache, nrows=0, engine=engine)
+    columns = list(header.columns)
+
+    if 'Elapsed Time (hr)' in columns:
+        df = read_result_file(filepath, use_cache=use_cache,
+                              usecols=['Elapsed Time (hr)'], engine=engine)
+        elapsed = df['Elapsed Time (hr)']
+        return columns, len(df), (elapsed.min(), elapsed.max())
+
+    df = read_result_file(filepath, use_cache=use_cache, usecols=columns[:1],
+                          engine=engine)
+    return columns, len(df), None
 
 
-def print_file_info(filepath: str):
+def print_file_info(filepath: str, use_cache: bool = True, engine: str = 'auto'):
     """Print information about the result file."""
-    df = read_result_file(filepath)
+    info = None
+
+    # A valid parquet cache is faster than parsing the source, otherwise stream the file
+    if not (use_cache and PARQUET_AVAILABLE and _cache_is_valid(filepath)):
+        try:
+            info = scan_file_info(filepath)
+        except Exception as e:
+            print(f"Warning: Streaming read failed ({e}), reading full file")
+
+    if info is None:
+        info = read_file_info(filepath, use_cache=use_cache, engine=engine)
+
+    columns, row_count, elapsed_range = info
 
     print(f"\nFile: {filepath}")
-    print(f"Rows: {len(df)}")
-    print(f"Columns: {list(df.columns)}")
+    print(f"Rows: {row_count}")
+    print(f"Columns: {columns}")
 
-    measurements = get_measurement_columns(df)
+    measurements = get_measurement_columns(pd.DataFrame(columns=columns))
     print(f"\nMeasurement columns:")
     for col in measurements:
         print(f"  - {col}")
 
-    if 'Elapsed Time (hr)' in df.columns:
-        elapsed = df['Elapsed Time (hr)']
-        print(f"\nTime range: {elapsed.min():.4f} hr to {elapsed.max():.4f} hr")
-        print(f"Duration: {elapsed.max() - elapsed.min():.4f} hours")
+    if elapsed_range is not None:
+        elapsed_min, elapsed_max = elapsed_range
+        print(f"\nTime range: {elapsed_min:.4f} hr to {elapsed_max:.4f} hr")
+        print(f"Duration: {elapsed_max - elapsed_min:.4f} hours")
+
+
+def plot_file(filepath: str, args, save_path: str = None, reuse_figure: bool = False):
+    """
+    Read one result file and plot it according to the command line options.
+
+    Args:
+        filepath: Path to the CSV or Excel file
+        args: Parsed command line arguments
+        save_path: Path to save the plot image (None to show it)
+        reuse_figure: Draw into a cached figure (for batch mode)
+    """
+    # Read data
+    print(f"Reading: {filepath}")
+    usecols = None
+    if args.columns:
+        usecols = ['Elapsed Time (hr)', *args.columns]
+    df = read_result_file(filepath, use_cache=not args.no_cache, usecols=usecols,
+                          engine=args.engine)
+
+    if args.columns and not any(col in df.columns for col in args.columns):
+        header = read_result_file(filepath, use_cache=not args.no_cache, nrows=0,
+                                  engine=args.engine)
+        print(f"Error: None of the specified columns found")
+        print(f"Available columns: {get_measurement_columns(header)}")
+        return
+
+    # Generate title from filename if not provided
+    title = args.title
+    if not title:
+        filename = Path(filepath).stem
+        title = filename.replace('_', ' ')
+
+    # Plot
+    if args.subplots:
+        plot_subplots(df, columns=args.columns, title=title, save_path=save_path,
+                      reuse_figure=reuse_figure)
+    else:
+        plot_results(df, columns=args.columns, dual_axis=args.dual_axis,
+                    title=title, save_path=save_path,
+                    ylabel_left=args.ylabel_left, ylabel_right=args.ylabel_right,
+                    grid_x=args.grid_x, grid_y_left=args.grid_y,
+                    grid_y_right=args.grid_y_right, grid_minor=args.grid_minor,
+                    reuse_figure=reuse_figure)
+
+
+def plot_batch(pattern: str, args):
+    """
+    Plot every file matching a glob pattern in one process.
+
+    Each plot is saved as <file stem>.png, next to its source file or in
+    the --output directory if given. One figure is reused for all files.
+
+    Args:
+        pattern: Glob pattern (e.g. "results/*_FINAL.csv")
+        args: Parsed command line arguments
+    """
+    files = sorted(glob.glob(pattern))
+    if not files:
+        print(f"No files match: {pattern}")
+        return
+
+    output_dir = args.output
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    plt.switch_backend('Agg')
+
+    print(f"Plotting {len(files)} file(s)")
+    for filepath in files:
+        save_dir = output_dir or os.path.dirname(filepath)
+        save_path = os.path.join(save_dir, Path(filepath).stem + '.png')
+        try:
+            plot_file(filepath, args, save_path=save_path, reuse_figure=True)
+        except Exception as e:
+            print(f"Error plotting {filepath}: {e}")
+
+    plt.close('all')
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description='Plot measurement results from Excel files',
+        description='Plot measurement results from CSV or Excel files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -378,7 +940,7 @@ Examples:
   python GENERAL_all_plot-results.py --list
 
   # Plot all measurements from a file
-  python GENERAL_all_plot-results.py results/Result_FINAL.xlsx
+  python GENERAL_all_plot-results.py results/Result_FINAL.csv
 
   # Plot specific columns
   python GENERAL_all_plot-results.py results/file.xlsx -c "Watts (W)" "kWh"
@@ -409,10 +971,16 @@ Examples:
 
   # Save plot to file
   python GENERAL_all_plot-results.py results/file.xlsx -o output.png
+
+  # Re-read the source file, ignoring the parquet cache
+  python GENERAL_all_plot-results.py results/file.xlsx --no-cache
+
+  # Plot every matching file to PNG (saved next to each file, or into -o DIR)
+  python GENERAL_all_plot-results.py --batch "results/*_FINAL.csv" --dual-axis -o plots
         """
     )
 
-    parser.add_argument('filepath', nargs='?', help='Path to Excel result file')
+    parser.add_argument('filepath', nargs='?', help='Path to CSV or Excel result file')
     parser.add_argument('--list', '-l', action='store_true',
                        help='List available result files')
     parser.add_argument('--columns', '-c', nargs='+',
@@ -437,9 +1005,24 @@ Examples:
     parser.add_argument('--title', '-t', help='Plot title')
     parser.add_argument('--info', '-i', action='store_true',
                        help='Show file information only')
+    parser.add_argument('--batch', '-b', metavar='PATTERN',
+                       help='Plot all files matching a glob pattern to PNG (-o sets output directory)')
+    parser.add_argument('--engine', choices=READ_ENGINES, default='auto',
+                       help='File reader: pandas, polars, or auto (polars if installed)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the parquet cache file')
 
     args = parser.parse_args()
 
+    # Saving only: use the non-interactive backend and skip GUI initialization
+    if args.output:
+        plt.switch_backend('Agg')
+
+    # Batch mode
+    if args.batch:
+        plot_batch(args.batch, args)
+        return
+
     # List result files
     if args.list:
         files = list_result_files()
@@ -464,28 +1047,10 @@ Examples:
 
     # Show file info
     if args.info:
-        print_file_info(args.filepath)
+        print_file_info(args.filepath, use_cache=not args.no_cache, engine=args.engine)
         return
 
-    # Read data
-    print(f"Reading: {args.filepath}")
-    df = read_result_file(args.filepath)
-
-    # Generate title from filename if not provided
-    title = args.title
-    if not title:
-        filename = Path(args.filepath).stem
-        title = filename.replace('_', ' ')
-
-    # Plot
-    if args.subplots:
-        plot_subplots(df, columns=args.columns, title=title, save_path=args.output)
-    else:
-        plot_results(df, columns=args.columns, dual_axis=args.dual_axis,
-                    title=title, save_path=args.output,
-                    ylabel_left=args.ylabel_left, ylabel_right=args.ylabel_right,
-                    grid_x=args.grid_x, grid_y_left=args.grid_y,
-                    grid_y_right=args.grid_y_right, grid_minor=args.grid_minor)
+    plot_file(args.filepath, args, save_path=args.output)
 
 
 if __name__ == "__main__":
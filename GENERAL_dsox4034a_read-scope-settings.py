@@ -3,12 +3,15 @@ Read Current Oscilloscope Settings
 
 This script connects to your oscilloscope and reads all current settings
 including trigger, vertical scale, horizontal scale, and measurement configuration.
+Related settings are read with one batched SCPI query per section.
 
 Usage:
     python read_scope_settings.py
 """
 
 from instruments.keysight.dsox4034a import DSOX4034A
+import io
+import sys
 import time
 
 # Your oscilloscope address
@@ -16,136 +19,136 @@ RESOURCE_STRING = "TCPIP::192.168.2.60::INSTR"
 
 
 def read_all_settings(scope):
-    """Read and display all current oscilloscope settings."""
+    """
+    Read and display all current oscilloscope settings.
+
+    The settings report is collected in memory and written to the console in
+    one call, since per-line console writes are slow on some terminals. The
+    speed test prints as it goes.
+    """
+    out = io.StringIO()
+    try:
+        _write_settings(scope, out)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
-    print("="*70)
-    print("OSCILLOSCOPE SETTINGS")
-    print("="*70)
+    _speed_test(scope)
+    print("\n" + "="*70)
 
-    # Instrument identification
-    print("\n[INSTRUMENT IDENTIFICATION]")
-    print(f"ID: {scope.identify()}")
 
-    # Acquisition mode
-    print("\n[ACQUISITION MODE]")
-    try:
-        acquire_type = scope.query(":ACQ:TYPE?")
-        print(f"Acquire Type: {acquire_type}")
+def _write_settings(scope, out):
+    """Write the settings report to the text stream out (see read_all_settings)."""
 
-        acquire_mode = scope.query(":ACQ:MODE?")
-        print(f"Acquire Mode: {acquire_mode}")
+    print("="*70, file=out)
+    print("OSCILLOSCOPE SETTINGS", file=out)
+    print("="*70, file=out)
 
-        acquire_count = scope.query(":ACQ:COUN?")
-        print(f"Acquire Count: {acquire_count}")
+    # Instrument identification
+    print("\n[INSTRUMENT IDENTIFICATION]", file=out)
+    print(f"ID: {scope.identify()}", file=out)
 
+    # Acquisition mode
+    print("\n[ACQUISITION MODE]", file=out)
+    try:
+        acquire_type, acquire_mode, acquire_count, operand_register = scope.query_batch(
+            [":ACQ:TYPE?", ":ACQ:MODE?", ":ACQ:COUN?", ":OPER:COND?"])
+        print(f"Acquire Type: {acquire_type}", file=out)
+        print(f"Acquire Mode: {acquire_mode}", file=out)
+        print(f"Acquire Count: {acquire_count}", file=out)
         # Check if running or stopped
-        operand_register = scope.query(":OPER:COND?")
-        print(f"Operational Condition: {operand_register}")
+        print(f"Operational Condition: {operand_register}", file=out)
     except Exception as e:
-        print(f"Error reading acquisition: {e}")
-
-    # Channel settings for all channels
-    for ch in [1, 2, 3, 4]:
-        print(f"\n[CHANNEL {ch}]")
-        try:
-            is_on = scope.is_channel_on(ch)
-            print(f"Display: {'ON' if is_on else 'OFF'}")
-
-            if is_on:
-                scale = scope.get_channel_scale(ch)
-                print(f"Vertical Scale: {scale} V/div")
-
-                offset = scope.get_channel_offset(ch)
-                print(f"Vertical Offset: {offset} V")
+        print(f"Error reading acquisition: {e}", file=out)
 
-                coupling = scope.get_channel_coupling(ch)
-                print(f"Coupling: {coupling}")
+    # Channel settings for all channels, fetched in a single round trip
+    channels = [1, 2, 3, 4]
+    channel_queries = [":DISP?", ":SCAL?", ":OFFS?", ":COUP?", ":PROB?", ":BWL?"]
+    try:
+        responses = scope.query_batch(
+            [f":CHAN{ch}{query}" for ch in channels for query in channel_queries])
+    except Exception as e:
+        print(f"\nError reading channels: {e}", file=out)
+        responses = []
 
-                probe = scope.query(f":CHAN{ch}:PROB?")
-                print(f"Probe Attenuation: {probe}")
+    n = len(channel_queries)
+    for i, ch in enumerate(channels[:len(responses) // n]):
+        print(f"\n[CHANNEL {ch}]", file=out)
+        display, scale, offset, coupling, probe, bwlimit = responses[i * n:(i + 1) * n]
+        is_on = display == "1"
+        print(f"Display: {'ON' if is_on else 'OFF'}", file=out)
 
-                bwlimit = scope.query(f":CHAN{ch}:BWL?")
-                print(f"Bandwidth Limit: {bwlimit}")
-        except Exception as e:
-            print(f"Error reading channel {ch}: {e}")
+        if is_on:
+            try:
+                print(f"Vertical Scale: {float(scale)} V/div", file=out)
+                print(f"Vertical Offset: {float(offset)} V", file=out)
+                print(f"Coupling: {coupling}", file=out)
+                print(f"Probe Attenuation: {probe}", file=out)
+                print(f"Bandwidth Limit: {bwlimit}", file=out)
+            except Exception as e:
+                print(f"Error reading channel {ch}: {e}", file=out)
 
     # Timebase settings
-    print("\n[TIMEBASE (HORIZONTAL)]")
+    print("\n[TIMEBASE (HORIZONTAL)]", file=out)
     try:
-        scale = scope.get_timebase_scale()
-        print(f"Horizontal Scale: {scale} s/div")
-
-        position = scope.get_timebase_position()
-        print(f"Horizontal Position: {position} s")
-
-        mode = scope.query(":TIM:MODE?")
-        print(f"Timebase Mode: {mode}")
-
-        reference = scope.query(":TIM:REF?")
-        print(f"Reference: {reference}")
+        scale, position, mode, reference = scope.query_batch(
+            [":TIM:SCAL?", ":TIM:POS?", ":TIM:MODE?", ":TIM:REF?"])
+        print(f"Horizontal Scale: {float(scale)} s/div", file=out)
+        print(f"Horizontal Position: {float(position)} s", file=out)
+        print(f"Timebase Mode: {mode}", file=out)
+        print(f"Reference: {reference}", file=out)
     except Exception as e:
-        print(f"Error reading timebase: {e}")
+        print(f"Error reading timebase: {e}", file=out)
 
     # Trigger settings
-    print("\n[TRIGGER]")
+    print("\n[TRIGGER]", file=out)
     try:
-        mode = scope.get_trigger_mode()
-        print(f"Trigger Mode: {mode}")
-
-        source = scope.get_trigger_source()
-        print(f"Trigger Source: {source}")
-
-        level = scope.get_trigger_level()
-        print(f"Trigger Level: {level} V")
-
-        slope = scope.get_trigger_slope()
-        print(f"Trigger Slope: {slope}")
-
-        sweep = scope.query(":TRIG:SWE?")
-        print(f"Trigger Sweep: {sweep}")
-
-        coupling = scope.query(":TRIG:EDGE:COUP?")
-        print(f"Trigger Coupling: {coupling}")
+        mode, source, level, slope, sweep, coupling = scope.query_batch(
+            [":TRIG:MODE?", ":TRIG:EDGE:SOUR?", ":TRIG:LEV?", ":TRIG:EDGE:SLOP?",
+             ":TRIG:SWE?", ":TRIG:EDGE:COUP?"])
+        print(f"Trigger Mode: {mode}", file=out)
+        print(f"Trigger Source: {source}", file=out)
+        print(f"Trigger Level: {float(level)} V", file=out)
+        print(f"Trigger Slope: {slope}", file=out)
+        print(f"Trigger Sweep: {sweep}", file=out)
+        print(f"Trigger Coupling: {coupling}", file=out)
     except Exception as e:
-        print(f"Error reading trigger: {e}")
+        print(f"Error reading trigger: {e}", file=out)
 
     # Measurement settings
-    print("\n[MEASUREMENTS]")
+    print("\n[MEASUREMENTS]", file=out)
     try:
         # Check if any measurements are displayed
         for i in range(1, 6):  # Check measurement slots 1-5
             try:
                 source = scope.query(f":MEAS:SOUR{i}?")
                 if source and source != "NONE":
-                    print(f"Measurement {i} Source: {source}")
+                    print(f"Measurement {i} Source: {source}", file=out)
             except:
                 pass
 
         # Check measurement statistics
         stats = scope.query(":MEAS:STAT?")
-        print(f"Statistics Display: {stats}")
+        print(f"Statistics Display: {stats}", file=out)
 
     except Exception as e:
-        print(f"Error reading measurements: {e}")
+        print(f"Error reading measurements: {e}", file=out)
 
     # Waveform settings
-    print("\n[WAVEFORM ACQUISITION]")
+    print("\n[WAVEFORM ACQUISITION]", file=out)
     try:
-        source = scope.query(":WAV:SOUR?")
-        print(f"Waveform Source: {source}")
-
-        format = scope.query(":WAV:FORM?")
-        print(f"Waveform Format: {format}")
-
-        points_mode = scope.query(":WAV:POIN:MODE?")
-        print(f"Points Mode: {points_mode}")
-
-        points = scope.query(":WAV:POIN?")
-        print(f"Points: {points}")
+        source, format, points_mode, points = scope.query_batch(
+            [":WAV:SOUR?", ":WAV:FORM?", ":WAV:POIN:MODE?", ":WAV:POIN?"])
+        print(f"Waveform Source: {source}", file=out)
+        print(f"Waveform Format: {format}", file=out)
+        print(f"Points Mode: {points_mode}", file=out)
+        print(f"Points: {points}", file=out)
     except Exception as e:
-        print(f"Error reading waveform settings: {e}")
+        print(f"Error reading waveform settings: {e}", file=out)
 
-    # Test measurement speed
+
+def _speed_test(scope):
+    """Time VRMS measurements and print the results as they come in."""
     print("\n[MEASUREMENT SPEED TEST]")
     print("Testing VRMS measurement speed...")
 
@@ -181,8 +184,6 @@ def read_all_settings(scope):
     except Exception as e:
         print(f"Error testing measurement speed: {e}")
 
-    print("\n" + "="*70)
-
 
 def main():
     """Main function."""
@@ -33,6 +33,7 @@ import sys
 import signal
 import time
 import math
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(__file__).rsplit('\\', 2)[0])
@@ -66,6 +67,15 @@ class DualInstrumentLogger(BaseDataLogger):
     BETA = 3600.0           # Beta value (K)
     T25 = 298.15            # 25°C in Kelvin
 
+    # Precomputed terms for the per-sample conversion
+    _INV_T25 = 1.0 / T25
+    _INV_BETA = 1.0 / BETA
+    _INV_R25 = 1.0 / R25
+    _R_REF_TIMES_VEXC = R_REFERENCE * V_EXCITATION
+
+    # Scope Vrms query, encoded once for the measurement loop
+    VRMS_QUERY = b":MEAS:VRMS? CHAN1\n"
+
     def __init__(self, dmm_resource=None, scope_resource=None, **kwargs):
         """
         Initialize the dual instrument logger.
@@ -84,6 +94,9 @@ class DualInstrumentLogger(BaseDataLogger):
         self.scope_resource = scope_resource
         self.dmm = None
         self.scope = None
+        self._pool = None  # Reads both instruments concurrently
+        self._scope_write = None  # Bound VISA write_raw/read_raw for the Vrms query
+        self._scope_read = None
 
     def calculate_ntc_resistance(self, voltage):
         """
@@ -102,8 +115,8 @@ class DualInstrumentLogger(BaseDataLogger):
         if voltage <= 0 or voltage >= self.V_EXCITATION:
             return None
 
-        # R_NTC = R_ref * (V_exc - V_meas) / V_meas
-        r_ntc = self.R_REFERENCE * (self.V_EXCITATION - voltage) / voltage
+        # R_NTC = R_ref * (V_exc - V_meas) / V_meas = R_ref * V_exc / V_meas - R_ref
+        r_ntc = self._R_REF_TIMES_VEXC / voltage - self.R_REFERENCE
         return r_ntc
 
     def calculate_temperature(self, resistance):
@@ -125,13 +138,30 @@ class DualInstrumentLogger(BaseDataLogger):
 
         try:
             # Beta equation: 1/T = 1/T25 + (1/B) * ln(R/R25)
-            inv_t = (1.0 / self.T25) + (1.0 / self.BETA) * math.log(resistance / self.R25)
-            temp_k = 1.0 / inv_t
-            temp_c = temp_k - 273.15
-            return temp_c
+            inv_t = self._INV_T25 + self._INV_BETA * math.log(resistance * self._INV_R25)
+            return 1.0 / inv_t - 273.15
         except (ValueError, ZeroDivisionError):
             return None
 
+    def voltage_to_temperature(self, voltage):
+        """
+        Convert a divider voltage straight to NTC temperature.
+
+        Same result as calculate_ntc_resistance() followed by
+        calculate_temperature(), in a single call for the measurement loop.
+
+        Args:
+            voltage: Measured voltage at divider midpoint
+
+        Returns:
+            Temperature in Celsius, or None if the voltage is out of range
+        """
+        if voltage <= 0 or voltage >= self.V_EXCITATION:
+            return None
+
+        r_ntc = self._R_REF_TIMES_VEXC / voltage - self.R_REFERENCE
+        return 1.0 / (self._INV_T25 + self._INV_BETA * math.log(r_ntc * self._INV_R25)) - 273.15
+
     def setup_instrument(self):
         """Connect and configure both instruments."""
         # ===== Setup A34405A DMM =====
@@ -140,6 +170,7 @@ class DualInstrumentLogger(BaseDataLogger):
         print("="*50)
         self.dmm = A34405A(self.dmm_resource)
         self.dmm.connect()
+        print(f"Connected to: {self.dmm.identify()}")
 
         # Configure for DC voltage measurement in auto-range
         self.dmm.configure_dc_voltage()
@@ -154,6 +185,10 @@ class DualInstrumentLogger(BaseDataLogger):
         self.scope = DSOX4034A(self.scope_resource)
         self.scope.connect()
 
+        # Call the VISA resource directly in the loop, skipping the driver wrappers
+        self._scope_write = self.scope.instrument.write_raw
+        self._scope_read = self.scope.instrument.read_raw
+
         # Ensure Channel 1 is on
         self.scope.channel_on(1)
 
@@ -186,7 +221,7 @@ class DualInstrumentLogger(BaseDataLogger):
         print("Configuring scope measurements...")
         self.scope.write(":MEAS:CLE")
         self.scope.write(":MEAS:VRMS CHAN1")
-        self.scope.write(":MEAS:STAT OFF")
+        self.scope.write(":MEAS:STAT:DISP OFF")  # :MEAS:STAT has no OFF setting
 
         # Wait for measurement to stabilize
         time.sleep(0.5)
@@ -213,10 +248,26 @@ class DualInstrumentLogger(BaseDataLogger):
         except Exception as e:
             print(f"  Scope test failed: {e}")
 
+        # DMM (USB) and scope (LAN) reads are independent, run them in parallel
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
         print("\n" + "="*50)
         print("Both instruments configured successfully!")
         print("="*50)
 
+    def read_vrms(self):
+        """
+        Read Channel 1 Vrms from the oscilloscope.
+
+        :MEASure results are always returned as NR3 ASCII (the DSOX has no
+        :FORMat subsystem), so the raw reply bytes are parsed directly.
+
+        Returns:
+            Vrms value in volts
+        """
+        self._scope_write(self.VRMS_QUERY)
+        return float(self._scope_read())
+
     def read_measurement(self):
         """
         Read measurements from both instruments and calculate temperature.
@@ -228,21 +279,23 @@ class DualInstrumentLogger(BaseDataLogger):
         vrms = None
         temperature = None
 
+        # Start both reads at once so the loop waits for the slower one only
+        dmm_future = self._pool.submit(self.dmm.read)
+        vrms_future = self._pool.submit(self.read_vrms)
+
         # Read DC voltage from DMM
         try:
-            dc_voltage = self.dmm.read()
+            dc_voltage = dmm_future.result()
 
             # Calculate NTC temperature from voltage
             if dc_voltage is not None:
-                r_ntc = self.calculate_ntc_resistance(dc_voltage)
-                temperature = self.calculate_temperature(r_ntc)
+                temperature = self.voltage_to_temperature(dc_voltage)
         except Exception as e:
             print(f"Error reading DMM: {e}")
 
         # Read Vrms from oscilloscope
         try:
-            vrms_str = self.scope.query(":MEAS:VRMS? CHAN1")
-            vrms = float(vrms_str)
+            vrms = vrms_future.result()
         except Exception as e:
             print(f"Error reading scope: {e}")
 
@@ -255,6 +308,9 @@ class DualInstrumentLogger(BaseDataLogger):
 
     def cleanup_instrument(self):
         """Disconnect both instruments."""
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         if self.dmm:
             self.dmm.disconnect()
         if self.scope:
@@ -36,13 +36,38 @@ import sys
 import signal
 import time
 import math
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(__file__).rsplit('\\', 2)[0])
 
 from instruments.base_logger import BaseDataLogger
-from instruments.digilent import AnalogDiscovery2
-from instruments.keysight import DSOX4034A
+
+# Instrument drivers are imported in setup_instrument(): the AD2 driver loads
+# the WaveForms runtime on import, which the offline helpers here do not need
+
+
+if NUMBA_AVAILABLE:
+    # fastmath without 'nnan'/'ninf' so NaN samples still fail the range check
+    @njit(parallel=True, cache=True,
+          fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _beta_temp_kernel(v, out, v_exc, r_ref, inv_t25, inv_beta, inv_r25):
+        """Fused divider + Beta-equation conversion over a 1-D voltage array."""
+        for i in prange(v.size):
+            x = v[i]
+            if x > 0.0 and x < v_exc:
+                r_ntc = r_ref * (v_exc - x) / x
+                out[i] = 1.0 / (inv_t25 + inv_beta * math.log(r_ntc * inv_r25)) - 273.15
+            else:
+                out[i] = np.nan
 
 
 class DualInstrumentLoggerAD2(BaseDataLogger):
@@ -73,6 +98,18 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
     BETA = 3600.0           # Beta value (K)
     T25 = 298.15            # 25°C in Kelvin
 
+    # Precomputed terms for the per-sample conversion
+    _INV_T25 = 1.0 / T25
+    _INV_BETA = 1.0 / BETA
+    _INV_R25 = 1.0 / R25
+    _R_REF_TIMES_VEXC = R_REFERENCE * V_EXCITATION
+
+    # Scope Vrms query, encoded once for the measurement loop
+    VRMS_QUERY = b":MEAS:VRMS? CHAN1\n"
+
+    # Console line template: timestamp, DC voltage, Vrms, temperature text, elapsed ms
+    _DISPLAY_LINE = "{} | DC: {:8.4f} V | Vrms: {:8.4f} V | Temp: {} C | {:8.1f} ms".format
+
     def __init__(self, ad2_device_index=-1, scope_resource=None, **kwargs):
         """
         Initialize the dual instrument logger.
@@ -91,6 +128,10 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         self.scope_resource = scope_resource
         self.ad2 = None
         self.scope = None
+        self._pool = None  # Reads both instruments concurrently
+        self._ad2_scratch = None  # Sample buffer reused by every AD2 read
+        self._scope_write = None  # Bound VISA write_raw/read_raw for the Vrms query
+        self._scope_read = None
 
     def calculate_ntc_resistance(self, voltage):
         """
@@ -109,8 +150,8 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         if voltage <= 0 or voltage >= self.V_EXCITATION:
             return None
 
-        # R_NTC = R_ref * (V_exc - V_meas) / V_meas
-        r_ntc = self.R_REFERENCE * (self.V_EXCITATION - voltage) / voltage
+        # R_NTC = R_ref * (V_exc - V_meas) / V_meas = R_ref * V_exc / V_meas - R_ref
+        r_ntc = self._R_REF_TIMES_VEXC / voltage - self.R_REFERENCE
         return r_ntc
 
     def calculate_temperature(self, resistance):
@@ -132,15 +173,66 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
 
         try:
             # Beta equation: 1/T = 1/T25 + (1/B) * ln(R/R25)
-            inv_t = (1.0 / self.T25) + (1.0 / self.BETA) * math.log(resistance / self.R25)
-            temp_k = 1.0 / inv_t
-            temp_c = temp_k - 273.15
-            return temp_c
+            inv_t = self._INV_T25 + self._INV_BETA * math.log(resistance * self._INV_R25)
+            return 1.0 / inv_t - 273.15
         except (ValueError, ZeroDivisionError):
             return None
 
+    def voltage_to_temperature(self, voltage):
+        """
+        Convert a divider voltage straight to NTC temperature.
+
+        Same result as calculate_ntc_resistance() followed by
+        calculate_temperature(), in a single call for the measurement loop.
+
+        Args:
+            voltage: Measured voltage at divider midpoint
+
+        Returns:
+            Temperature in Celsius, or None if the voltage is out of range
+        """
+        if voltage <= 0 or voltage >= self.V_EXCITATION:
+            return None
+
+        r_ntc = self._R_REF_TIMES_VEXC / voltage - self.R_REFERENCE
+        return 1.0 / (self._INV_T25 + self._INV_BETA * math.log(r_ntc * self._INV_R25)) - 273.15
+
+    @classmethod
+    def voltages_to_temps_c(cls, voltages):
+        """
+        Convert divider voltages to NTC temperatures for a whole array.
+
+        Vectorized version of calculate_ntc_resistance + calculate_temperature
+        for reprocessing logged data. Voltages outside (0, V_EXCITATION) give NaN.
+        Uses a parallel numba kernel when numba is installed, NumPy otherwise.
+
+        Args:
+            voltages: Array-like of measured voltages
+
+        Returns:
+            Numpy array of temperatures in Celsius
+        """
+        v = np.asarray(voltages, dtype=np.float64)
+
+        if NUMBA_AVAILABLE:
+            flat = np.ascontiguousarray(v).ravel()
+            out = np.empty_like(flat)
+            _beta_temp_kernel(flat, out, cls.V_EXCITATION, cls.R_REFERENCE,
+                              cls._INV_T25, cls._INV_BETA, cls._INV_R25)
+            return out.reshape(v.shape)
+
+        temps = np.full(v.shape, np.nan)
+
+        valid = (v > 0) & (v < cls.V_EXCITATION)
+        r_ntc = cls._R_REF_TIMES_VEXC / v[valid] - cls.R_REFERENCE
+        temps[valid] = 1.0 / (cls._INV_T25 + cls._INV_BETA * np.log(r_ntc * cls._INV_R25)) - 273.15
+        return temps
+
     def setup_instrument(self):
         """Connect and configure both instruments."""
+        from instruments.digilent import AnalogDiscovery2
+        from instruments.keysight import DSOX4034A
+
         # ===== Setup Analog Discovery 2 =====
         print("="*50)
         print("Setting up Digilent Analog Discovery 2...")
@@ -163,9 +255,13 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         print("\n" + "="*50)
         print("Setting up Keysight DSOX4034A Oscilloscope...")
         print("="*50)
-        self.scope = DSOX4034A(self.scope_resource)
+        self.scope = DSOX4034A(self.scope_resource, chunk_size=4096)
         self.scope.connect()
 
+        # Call the VISA resource directly in the loop, skipping the driver wrappers
+        self._scope_write = self.scope.instrument.write_raw
+        self._scope_read = self.scope.instrument.read_raw
+
         # Ensure Channel 1 is on
         self.scope.channel_on(1)
 
@@ -198,7 +294,7 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         print("Configuring scope measurements...")
         self.scope.write(":MEAS:CLE")
         self.scope.write(":MEAS:VRMS CHAN1")
-        self.scope.write(":MEAS:STAT OFF")
+        self.scope.write(":MEAS:STAT:DISP OFF")  # :MEAS:STAT has no OFF setting
 
         # Wait for measurement to stabilize
         time.sleep(0.5)
@@ -225,10 +321,27 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         except Exception as e:
             print(f"  Scope test failed: {e}")
 
+        # AD2 (USB) and scope (LAN) reads are independent, run them in parallel
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._ad2_scratch = np.empty(50, dtype=np.float64)
+
         print("\n" + "="*50)
         print("Both instruments configured successfully!")
         print("="*50)
 
+    def read_vrms(self):
+        """
+        Read Channel 1 Vrms from the oscilloscope.
+
+        :MEASure results are always returned as NR3 ASCII (the DSOX has no
+        :FORMat subsystem), so the raw reply bytes are parsed directly.
+
+        Returns:
+            Vrms value in volts
+        """
+        self._scope_write(self.VRMS_QUERY)
+        return float(self._scope_read())
+
     def read_measurement(self):
         """
         Read measurements from both instruments and calculate temperature.
@@ -240,21 +353,24 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         vrms = None
         temperature = None
 
+        # Start both reads at once so the loop waits for the slower one only
+        ad2_future = self._pool.submit(self.ad2.read_analog_input, channel=0, samples=50,
+                                       out=self._ad2_scratch)
+        vrms_future = self._pool.submit(self.read_vrms)
+
         # Read DC voltage from AD2 (use averaging for accuracy)
         try:
-            dc_voltage = self.ad2.read_analog_input(channel=0, samples=50)
+            dc_voltage = ad2_future.result()
 
             # Calculate NTC temperature from voltage
             if dc_voltage is not None:
-                r_ntc = self.calculate_ntc_resistance(dc_voltage)
-                temperature = self.calculate_temperature(r_ntc)
+                temperature = self.voltage_to_temperature(dc_voltage)
         except Exception as e:
             print(f"Error reading AD2: {e}")
 
         # Read Vrms from oscilloscope
         try:
-            vrms_str = self.scope.query(":MEAS:VRMS? CHAN1")
-            vrms = float(vrms_str)
+            vrms = vrms_future.result()
         except Exception as e:
             print(f"Error reading scope: {e}")
 
@@ -267,6 +383,9 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
 
     def cleanup_instrument(self):
         """Disconnect both instruments."""
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         if self.ad2:
             self.ad2.disconnect()
         if self.scope:
@@ -287,7 +406,7 @@ class DualInstrumentLoggerAD2(BaseDataLogger):
         if measurement is not None:
             dc_voltage, vrms, temperature = measurement
             temp_str = f"{temperature:7.2f}" if temperature is not None else "   N/A"
-            return f"{timestamp_str} | DC: {dc_voltage:8.4f} V | Vrms: {vrms:8.4f} V | Temp: {temp_str} C | {elapsed_ms:8.1f} ms"
+            return self._DISPLAY_LINE(timestamp_str, dc_voltage, vrms, temp_str, elapsed_ms)
         return f"{timestamp_str} | Error | {elapsed_ms:8.1f} ms"
 
 
@@ -299,6 +418,8 @@ def signal_handler(signum, frame):
 
 def main():
     """Main entry point."""
+    from instruments.keysight import DSOX4034A
+
     print("="*60)
     print("Dual Instrument Logger (AD2 + DSOX4034A)")
     print("="*60)
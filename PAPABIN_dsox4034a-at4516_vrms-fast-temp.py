@@ -8,16 +8,25 @@ Features:
 - Oscilloscope: Fast Vrms measurement using built-in scope function
 - Temperature: AT4516 4-channel thermocouple readings (TC-K type)
 - Sampling: Every 1 second
-- Buffered writes for performance
+- Buffered writes for performance (rows stream to CSV, XLSX built once at the end)
 - Records Elapsed Time in ms and hr for plotting
 
+Output files:
+- Result_<timestamp>.csv: All rows, appended while logging
+- Result_<timestamp>.xlsx: Converted from the CSV when logging stops
+- Result_<timestamp>_FINAL.csv: Copy of the CSV, refreshed every 5 minutes
+  (open or plot this one with GENERAL_all_plot-results.py while logging)
+
 Usage:
-    python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py [SCOPE_RESOURCE] [TEMP_PORT] [save_interval]
+    python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py [SCOPE_RESOURCE] [TEMP_PORT] [save_interval] [--allow-drop]
 
 Arguments:
     SCOPE_RESOURCE: VISA resource string for oscilloscope (default: TCPIP::192.168.2.73::INSTR)
     TEMP_PORT: COM port for AT4516 (default: COM10)
-    save_interval: Number of measurements before saving to disk (default: 10)
+    save_interval: Number of measurements written and flushed to the CSV data file
+                   at a time (default: 10)
+    --allow-drop: Bound the in-memory queue to 10 x save_interval rows; if the disk
+                  falls behind, the oldest unsaved rows are dropped (for unattended runs)
 
 Example:
     # Use all defaults
@@ -30,24 +39,37 @@ Example:
     python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py "TCPIP::192.168.2.60::INSTR" "COM10" 20
 """
 
+import os
 import sys
+import csv
+import shutil
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Deque
 import threading
 import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from openpyxl import Workbook, load_workbook
-from instruments.keysight.dsox4034a import DSOX4034A
-from instruments.anbai import AT4516
+# openpyxl and the instrument drivers (pyvisa, pyserial) are imported where
+# they are first needed, so --help and argument errors return immediately
 
 
 class VrmsTempLogger:
     """Combined Vrms + Temperature data logger."""
 
+    # Scope Vrms query, encoded once for the measurement loop
+    VRMS_QUERY = b":MEAS:VRMS? CHAN1\n"
+
+    # XLSX column widths: Timestamp, Vrms, Temp Ch1-4, Elapsed Time (ms), Elapsed Time (hr)
+    COLUMN_WIDTHS = (20, 15, 15, 15, 15, 15, 20, 20)
+
+    # Console line template: timestamp, Vrms, four temperature texts, elapsed ms
+    _DISPLAY_LINE = "{:<15} {:10.6f}  {:<10} {:<10} {:<10} {:<10} {:13.1f}".format
+
     def __init__(self, scope_resource: str, temp_port: str, results_dir: str = "results",
-                 save_interval: int = 10):
+                 save_interval: int = 10, allow_drop: bool = False):
         """
         Initialize the combined logger.
 
@@ -55,7 +77,10 @@ class VrmsTempLogger:
             scope_resource: VISA resource string for oscilloscope
             temp_port: COM port for AT4516 temperature meter
             results_dir: Directory to save result files (default: "results")
-            save_interval: Number of measurements before saving to disk (default: 10)
+            save_interval: Number of measurements written and flushed to the CSV
+                data file at a time (default: 10)
+            allow_drop: Bound the row queue to 10 x save_interval rows and drop the
+                oldest unsaved rows when the writer falls behind (default: False)
         """
         self.scope_resource = scope_resource
         self.temp_port = temp_port
@@ -64,33 +89,54 @@ class VrmsTempLogger:
 
         self.scope = None
         self.temp_meter = None
-        self.workbook = None
-        self.worksheet = None
+        self._pool = None  # Reads both instruments concurrently
+        self._scope_write = None  # Bound VISA write_raw/read_raw for the Vrms query
+        self._scope_read = None
+        self.csv_file = None
+        self.csv_writer = None
+        self.csv_file_path = None
         self.main_file_path = None
         self.final_file_path = None
         self.running = False
-        self.data_lock = threading.Lock()
-        self.row_index = 2
+        self.headers: List[str] = []
         self.start_time = None
+        self._t0_ns = None  # monotonic anchor for elapsed time
         self.last_copy_time = None
         self.measurement_count = 0
 
-        # Buffer: (timestamp, vrms, temp1, temp2, temp3, temp4, elapsed_ms, elapsed_hr)
-        self.data_buffer: List[Tuple[str, float, float, float, float, float, float, float]] = []
+        # Row queue: (timestamp, vrms, temp1, temp2, temp3, temp4, elapsed_ms)
+        # Single producer (measurement loop) and single consumer (writer thread);
+        # deque append/popleft are atomic, so no lock is needed on the hot path.
+        # With allow_drop the queue is bounded and appending to a full queue
+        # discards the oldest row, so memory stays constant if the disk stalls.
+        self.data_buffer: Deque[Tuple[str, float, float, float, float, float, float, float]] = deque(
+            maxlen=10 * save_interval if allow_drop else None)
+        self.dropped_count = 0
+        self._flush_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._checkpoint_event = threading.Event()
+        self._stop_requested = False
 
         self.results_dir.mkdir(exist_ok=True)
 
     def connect(self) -> None:
         """Connect to both oscilloscope and temperature meter."""
+        from instruments.keysight.dsox4034a import DSOX4034A
+        from instruments.anbai import AT4516
+
         print("="*70)
         print("CONNECTING TO INSTRUMENTS")
         print("="*70)
 
         # Connect to oscilloscope
         print(f"\n1. Oscilloscope: {self.scope_resource}")
-        self.scope = DSOX4034A(self.scope_resource)
+        self.scope = DSOX4034A(self.scope_resource, chunk_size=4096)
         self.scope.connect()
 
+        # Call the VISA resource directly in the loop, skipping the driver wrappers
+        self._scope_write = self.scope.instrument.write_raw
+        self._scope_read = self.scope.instrument.read_raw
+
         # Configure oscilloscope for fast Vrms measurements
         self.scope.channel_on(1)
 
@@ -109,7 +155,7 @@ class VrmsTempLogger:
         # Set up VRMS measurement on scope
         self.scope.write(":MEAS:CLE")
         self.scope.write(":MEAS:VRMS CHAN1")
-        self.scope.write(":MEAS:STAT OFF")
+        self.scope.write(":MEAS:STAT:DISP OFF")  # :MEAS:STAT has no OFF setting
         time.sleep(0.5)
 
         # Test oscilloscope reading
@@ -136,12 +182,18 @@ class VrmsTempLogger:
         except Exception as e:
             print(f"   ✗ Warning: Test reading failed: {e}")
 
+        # Scope (LAN) and AT4516 (serial) reads are independent, run them in parallel
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
         print("\n" + "="*70)
         print("✓ ALL INSTRUMENTS CONNECTED AND CONFIGURED")
         print("="*70 + "\n")
 
     def disconnect(self) -> None:
         """Disconnect from all instruments."""
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         if self.scope:
             self.scope.disconnect()
             print("Disconnected from oscilloscope")
@@ -150,19 +202,18 @@ class VrmsTempLogger:
             print("Disconnected from temperature meter")
 
     def setup_excel_files(self) -> None:
-        """Create and initialize Excel files for data logging."""
+        """Create the result files for data logging."""
         self.start_time = datetime.now()
+        self._t0_ns = time.monotonic_ns()
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
 
+        self.csv_file_path = self.results_dir / f"Result_{timestamp}.csv"
         self.main_file_path = self.results_dir / f"Result_{timestamp}.xlsx"
-        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.xlsx"
-
-        self.workbook = Workbook()
-        self.worksheet = self.workbook.active
-        self.worksheet.title = "Vrms + Temperature"
+        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.csv"
 
         # Headers: Timestamp, Vrms, Temp1-4, Elapsed Time (ms), Elapsed Time (hr)
-        headers = [
+        # (the plotter uses Elapsed Time (hr) as the X axis, also for the FINAL CSV)
+        self.headers = [
             "Timestamp",
             "Vrms (V)",
             "Temp Ch1 (°C)",
@@ -172,23 +223,18 @@ class VrmsTempLogger:
             "Elapsed Time (ms)",
             "Elapsed Time (hr)"
         ]
-        self.worksheet.append(headers)
-
-        # Set column widths
-        self.worksheet.column_dimensions['A'].width = 20  # Timestamp
-        self.worksheet.column_dimensions['B'].width = 15  # Vrms
-        self.worksheet.column_dimensions['C'].width = 15  # Temp Ch1
-        self.worksheet.column_dimensions['D'].width = 15  # Temp Ch2
-        self.worksheet.column_dimensions['E'].width = 15  # Temp Ch3
-        self.worksheet.column_dimensions['F'].width = 15  # Temp Ch4
-        self.worksheet.column_dimensions['G'].width = 20  # Elapsed Time (ms)
-        self.worksheet.column_dimensions['H'].width = 20  # Elapsed Time (hr)
-
-        self.workbook.save(self.main_file_path)
+
+        # Rows stream to CSV through a 1 MB buffer; the XLSX is built once in close()
+        self.csv_file = open(self.csv_file_path, 'w', newline='', encoding='utf-8-sig',
+                             buffering=1 << 20)
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(self.headers)
+
         self.copy_to_final()
 
-        print(f"Created Excel files:")
-        print(f"  Main file: {self.main_file_path}")
+        print(f"Created result files:")
+        print(f"  Data file: {self.csv_file_path}")
+        print(f"  Main file: {self.main_file_path} (written when logging stops)")
         print(f"  FINAL file: {self.final_file_path}")
         print(f"  Save interval: every {self.save_interval} measurements")
 
@@ -196,12 +242,15 @@ class VrmsTempLogger:
         """
         Read Vrms from oscilloscope.
 
+        :MEASure results are always returned as NR3 ASCII (the DSOX has no
+        :FORMat subsystem), so the raw reply bytes are parsed directly.
+
         Returns:
             Vrms value in volts, or None if read failed
         """
         try:
-            vrms_str = self.scope.query(":MEAS:VRMS? CHAN1")
-            vrms = float(vrms_str)
+            self._scope_write(self.VRMS_QUERY)
+            vrms = float(self._scope_read())
             return vrms
         except Exception as e:
             print(f"Error reading Vrms: {e}")
@@ -234,54 +283,112 @@ class VrmsTempLogger:
             return [None, None, None, None]
 
     def buffer_data(self, timestamp_str: str, vrms: float, temps: List[float], elapsed_ms: float) -> None:
-        """Add data to buffer and flush when full."""
-        with self.data_lock:
-            elapsed_hr = elapsed_ms / 3_600_000  # Convert ms to hours
-
-            # Unpack temperature values
-            temp1, temp2, temp3, temp4 = temps[0], temps[1], temps[2], temps[3]
-
-            self.data_buffer.append((timestamp_str, vrms, temp1, temp2, temp3, temp4, elapsed_ms, elapsed_hr))
-            self.measurement_count += 1
-
-            if len(self.data_buffer) >= self.save_interval:
-                self.flush_buffer()
+        """Queue a row and wake the writer once save_interval rows are waiting."""
+        # Unpack temperature values
+        temp1, temp2, temp3, temp4 = temps[0], temps[1], temps[2], temps[3]
+        elapsed_hr = elapsed_ms / 3_600_000  # Convert ms to hours
+        row = (timestamp_str, vrms, temp1, temp2, temp3, temp4, elapsed_ms, elapsed_hr)
+
+        if len(self.data_buffer) == self.data_buffer.maxlen:
+            self.dropped_count += 1
+            if self.dropped_count % 100 == 1:
+                print(f"Warning: Writer is behind, dropped {self.dropped_count} rows so far")
+
+        self.data_buffer.append(row)
+        self.measurement_count += 1
+
+        if len(self.data_buffer) >= self.save_interval:
+            self._flush_event.set()
+
+    def _write_rows(self, rows) -> None:
+        """Append rows to the CSV data file and hand them to the OS."""
+        self.csv_writer.writerows(rows)
+        # Flush the 1 MB userspace buffer, so a crash or a closed console
+        # loses at most the rows still queued
+        self.csv_file.flush()
+
+    def _drain(self) -> list:
+        """Pop every queued row (consumer side of the row queue)."""
+        popleft = self.data_buffer.popleft
+        return [popleft() for _ in range(len(self.data_buffer))]
 
     def flush_buffer(self) -> None:
-        """Write buffered data to Excel file."""
+        """
+        Write the queued rows synchronously.
+
+        Only used while the writer thread is not running.
+        """
         if not self.data_buffer:
             return
 
         try:
-            for timestamp_str, vrms, temp1, temp2, temp3, temp4, elapsed_ms, elapsed_hr in self.data_buffer:
-                self.worksheet.cell(row=self.row_index, column=1, value=timestamp_str)
-                self.worksheet.cell(row=self.row_index, column=2, value=vrms)
-                self.worksheet.cell(row=self.row_index, column=3, value=temp1)
-                self.worksheet.cell(row=self.row_index, column=4, value=temp2)
-                self.worksheet.cell(row=self.row_index, column=5, value=temp3)
-                self.worksheet.cell(row=self.row_index, column=6, value=temp4)
-                self.worksheet.cell(row=self.row_index, column=7, value=elapsed_ms)
-                self.worksheet.cell(row=self.row_index, column=8, value=elapsed_hr)
-                self.row_index += 1
-
-            self.workbook.save(self.main_file_path)
-            self.data_buffer.clear()
+            self._write_rows(self._drain())
 
         except Exception as e:
             print(f"Error flushing buffer: {e}")
 
+    def _writer_loop(self) -> None:
+        """Writer thread: persist queued rows whenever the loop signals."""
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+
+            # Requests are set before the flush event, so they are visible after clear().
+            # The checkpoint event is only cleared when seen set: a request arriving
+            # after the check stays set for the next pass, one arriving before the
+            # clear is served by the FINAL write below
+            checkpoint = self._checkpoint_event.is_set()
+            if checkpoint:
+                self._checkpoint_event.clear()
+            stop = self._stop_requested
+
+            # Disk work happens here, acquisition keeps running
+            try:
+                self._write_rows(self._drain())
+            except Exception as e:
+                print(f"Error flushing buffer: {e}")
+
+            if checkpoint or stop:
+                self._write_final()
+            if stop:
+                return
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread."""
+        self._stop_requested = False
+        self._flush_event.clear()
+        self._writer = threading.Thread(target=self._writer_loop, name="csv-writer", daemon=True)
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        """Ask the writer to drain the queue and write FINAL, then wait for it."""
+        if self._writer is None:
+            return
+        self._stop_requested = True
+        self._flush_event.set()
+        self._writer.join()
+        self._writer = None
+
     def copy_to_final(self) -> None:
-        """Copy the main file to the FINAL file."""
-        try:
-            with self.data_lock:
-                self.flush_buffer()
-                self.workbook.save(self.main_file_path)
+        """Update the FINAL CSV snapshot (queued to the writer thread if running)."""
+        self.last_copy_time = time.monotonic()
+
+        if self._writer is not None:
+            self._checkpoint_event.set()
+            self._flush_event.set()
+            return
 
-            wb_copy = load_workbook(self.main_file_path)
-            wb_copy.save(self.final_file_path)
-            wb_copy.close()
+        self.flush_buffer()
+        self._write_final()
+
+    def _write_final(self) -> None:
+        """Flush the CSV data file and copy it to the FINAL file."""
+        try:
+            # Rows are already flushed; force the data file to disk as well
+            self.csv_file.flush()
+            os.fsync(self.csv_file.fileno())
+            shutil.copyfile(self.csv_file_path, self.final_file_path)
 
-            self.last_copy_time = time.time()
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Updated FINAL file ({self.measurement_count} measurements)")
 
         except Exception as e:
@@ -302,54 +409,63 @@ class VrmsTempLogger:
         print("-"*90)
 
         self.running = True
-        self.last_copy_time = time.time()
+        self.last_copy_time = time.monotonic()
+        self._start_writer()
 
+        # Scheduling and elapsed time use the monotonic clock, so wall-clock
+        # adjustments (NTP) cannot shift samples; wall time is only for display
         target_interval = 1.0  # 1 second
-        next_measurement_time = time.time()
+        next_measurement_time = time.monotonic()
+
+        # Bind loop-invariant lookups once
+        t0_ns = self._t0_ns
+        submit = self._pool.submit
+        read_vrms = self.read_vrms
+        read_temperatures = self.read_temperatures
+        buffer_data = self.buffer_data
+        display_line = self._DISPLAY_LINE
+        _time = time.time
+        _monotonic = time.monotonic
+        _monotonic_ns = time.monotonic_ns
+        _strftime = time.strftime
+        _localtime = time.localtime
+        _sleep = time.sleep
 
         try:
             while self.running:
-                now = datetime.now()
-                timestamp_str = now.strftime("%H:%M:%S") + f":{now.microsecond // 1000:03d}"
+                now = _time()
+                timestamp_str = _strftime("%H:%M:%S", _localtime(now)) + f":{int(now * 1000) % 1000:03d}"
 
                 # Calculate elapsed time in milliseconds from start
-                elapsed_ms = (now - self.start_time).total_seconds() * 1000
-
-                # Read Vrms from oscilloscope
-                vrms = self.read_vrms()
+                elapsed_ms = (_monotonic_ns() - t0_ns) * 1e-6
 
-                # Read temperatures from AT4516
-                temps = self.read_temperatures()
+                # Read Vrms (oscilloscope) and temperatures (AT4516) concurrently
+                vrms_future = submit(read_vrms)
+                temps_future = submit(read_temperatures)
+                vrms = vrms_future.result()
+                temps = temps_future.result()
 
                 if vrms is not None:
-                    self.buffer_data(timestamp_str, vrms, temps, elapsed_ms)
+                    buffer_data(timestamp_str, vrms, temps, elapsed_ms)
 
                     # Format temperature values for display
-                    temp_strs = []
-                    for temp in temps:
-                        if temp is not None:
-                            temp_strs.append(f"{temp:7.2f}")
-                        else:
-                            temp_strs.append("   N/A ")
-
-                    print(f"{timestamp_str:<15} {vrms:10.6f}  "
-                          f"{temp_strs[0]:<10} {temp_strs[1]:<10} {temp_strs[2]:<10} {temp_strs[3]:<10} "
-                          f"{elapsed_ms:13.1f}")
+                    temp_strs = [f"{temp:7.2f}" if temp is not None else "   N/A " for temp in temps]
+                    print(display_line(timestamp_str, vrms, *temp_strs, elapsed_ms))
 
                 # Check if 5 minutes have passed for FINAL file update
-                if time.time() - self.last_copy_time >= 300:
+                if _monotonic() - self.last_copy_time >= 300:
                     self.copy_to_final()
 
                 # Precise timing - next measurement in 1 second
                 next_measurement_time += target_interval
-                sleep_time = next_measurement_time - time.time()
+                sleep_time = next_measurement_time - _monotonic()
 
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    _sleep(sleep_time)
                 else:
                     if sleep_time < -target_interval:
                         print(f"Warning: Running {-sleep_time:.3f}s behind schedule")
-                        next_measurement_time = time.time()
+                        next_measurement_time = _monotonic()
 
         except KeyboardInterrupt:
             print("\n\nStopping data logging...")
@@ -357,24 +473,85 @@ class VrmsTempLogger:
 
         finally:
             print("Flushing buffered data...")
-            with self.data_lock:
-                self.flush_buffer()
-
-            print("Saving final data...")
-            self.copy_to_final()
+            self._stop_writer()
             print("Data logging completed!")
             print(f"Total measurements: {self.measurement_count}")
+            if self.dropped_count:
+                print(f"Dropped measurements: {self.dropped_count}")
 
     def close(self) -> None:
-        """Close all resources."""
-        if self.workbook:
-            with self.data_lock:
+        """Close the CSV data file and convert it to the Excel file."""
+        if self.csv_file is None:
+            return
+
+        try:
+            self.flush_buffer()
+            self.csv_file.close()
+            self._write_workbook()
+            print(f"Saved Excel file: {self.main_file_path}")
+        except Exception as e:
+            print(f"Error closing workbook: {e}")
+        finally:
+            self.csv_file = None
+            self.csv_writer = None
+
+    def _workbook_rows(self):
+        """Yield the XLSX header and rows converted back from the CSV data file."""
+        with open(self.csv_file_path, newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            yield header
+            for row in reader:
+                # A row cut short by a crash or a closed console is skipped
+                if len(row) != len(header):
+                    continue
+                # Numbers come back as text; empty cells are channels that failed (None)
                 try:
-                    self.flush_buffer()
-                    self.workbook.save(self.main_file_path)
-                    self.workbook.close()
-                except Exception as e:
-                    print(f"Error closing workbook: {e}")
+                    values = [row[0], *(float(v) if v else None for v in row[1:])]
+                except ValueError:
+                    continue
+                yield values
+
+    def _write_workbook(self) -> None:
+        """
+        Build the XLSX file from the CSV data file in a single pass.
+
+        Uses xlsxwriter in constant_memory mode when it is installed (one row in
+        RAM at a time, faster than openpyxl), otherwise an openpyxl write-only workbook.
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+
+        if xlsxwriter is not None:
+            workbook = xlsxwriter.Workbook(str(self.main_file_path), {'constant_memory': True})
+            worksheet = workbook.add_worksheet("Vrms + Temperature")
+            for col, width in enumerate(self.COLUMN_WIDTHS):
+                worksheet.set_column(col, col, width)
+            write_row = worksheet.write_row
+            for row_index, values in enumerate(self._workbook_rows()):
+                write_row(row_index, 0, values)
+            workbook.close()
+            return
+
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Vrms + Temperature")
+
+        # Set column widths (must be done before any row is appended)
+        for col, width in enumerate(self.COLUMN_WIDTHS, 1):
+            worksheet.column_dimensions[get_column_letter(col)].width = width
+
+        append = worksheet.append
+        for values in self._workbook_rows():
+            append(values)
+
+        # One large buffered handle instead of many small zip writes
+        with open(self.main_file_path, 'wb', buffering=1 << 20) as f:
+            workbook.save(f)
 
 
 def signal_handler(signum, frame):
@@ -390,14 +567,19 @@ def main():
     default_temp_port = "COM13"
     default_save_interval = 10
 
+    # Optional flag, the rest are positional
+    allow_drop = '--allow-drop' in sys.argv
+    args = [arg for arg in sys.argv if arg != '--allow-drop']
+
     # Show help if requested
-    if len(sys.argv) >= 2 and sys.argv[1] in ['-h', '--help']:
+    if len(args) >= 2 and args[1] in ['-h', '--help']:
         print("Usage:")
-        print("  python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py [SCOPE_RESOURCE] [TEMP_PORT] [save_interval]")
+        print("  python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py [SCOPE_RESOURCE] [TEMP_PORT] [save_interval] [--allow-drop]")
         print("\nArguments:")
         print(f"  SCOPE_RESOURCE: VISA resource for oscilloscope (default: {default_scope_resource})")
         print(f"  TEMP_PORT: COM port for AT4516 (default: {default_temp_port})")
-        print(f"  save_interval: Measurements before saving (default: {default_save_interval})")
+        print(f"  save_interval: Measurements per CSV write/flush (default: {default_save_interval})")
+        print("  --allow-drop: Bound the in-memory queue, dropping the oldest rows if the disk falls behind")
         print("\nExamples:")
         print('  python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py')
         print('  python PAPABIN_dsox4034a-at4516_vrms-fast-temp.py "TCPIP::192.168.2.60::INSTR" "COM5"')
@@ -406,29 +588,32 @@ def main():
 
     # Parse arguments
     scope_resource = default_scope_resource
-    if len(sys.argv) >= 2:
-        scope_resource = sys.argv[1]
+    if len(args) >= 2:
+        scope_resource = args[1]
 
     temp_port = default_temp_port
-    if len(sys.argv) >= 3:
-        temp_port = sys.argv[2]
+    if len(args) >= 3:
+        temp_port = args[2]
 
     save_interval = default_save_interval
-    if len(sys.argv) >= 4:
+    if len(args) >= 4:
         try:
-            save_interval = int(sys.argv[3])
+            save_interval = int(args[3])
         except ValueError:
-            print(f"Warning: Invalid save_interval '{sys.argv[3]}', using default: {default_save_interval}")
+            print(f"Warning: Invalid save_interval '{args[3]}', using default: {default_save_interval}")
 
     # Print configuration
     print(f"Configuration:")
     print(f"  Oscilloscope: {scope_resource}")
     print(f"  Temperature: {temp_port}")
     print(f"  Save interval: {save_interval}")
+    if allow_drop:
+        print(f"  Allow drop: up to {10 * save_interval} queued rows")
 
     signal.signal(signal.SIGINT, signal_handler)
 
-    logger = VrmsTempLogger(scope_resource, temp_port, save_interval=save_interval)
+    logger = VrmsTempLogger(scope_resource, temp_port, save_interval=save_interval,
+                            allow_drop=allow_drop)
 
     try:
         logger.connect()
@@ -10,24 +10,35 @@ Features:
 - Reads continuously-updated measurement value
 - No trigger wait - reads current displayed value
 - Configurable timebase for optimal measurement speed
-- Buffered writes for performance
+- Buffered writes for performance (streaming workbook: xlsxwriter
+  constant_memory if installed, else openpyxl write-only)
+- Disk writes on a background thread, so they never delay a sample
 - Precise 100ms timing
 - Records Elapsed Time in ms and hr for plotting
 
+Output files:
+- Result_<timestamp>.xlsx: Written once when logging stops
+- Result_<timestamp>_FINAL.csv: Snapshot of all rows, refreshed every 5 minutes
+  (open this one to check progress while logging)
+
 Usage:
-    python PAPABIN_dsox4034a_vrms-fast.py [RESOURCE_STRING] [save_interval] [timebase_ms] [holdoff_ms]
+    python PAPABIN_dsox4034a_vrms-fast.py [RESOURCE_STRING] [save_interval] [timebase_ms] [holdoff_ms] [flush_s]
 
 Arguments:
     RESOURCE_STRING: VISA resource string (default: TCPIP::192.168.2.60::INSTR)
-    save_interval: Number of measurements before saving to disk (default: 10)
+    save_interval: Most measurements buffered before they are handed to the
+                   workbook writer (default: 1000, so flushes are normally
+                   driven by flush_s)
     timebase_ms: Oscilloscope timebase in milliseconds/div (default: 5)
                  Shorter timebase = faster measurements
                  Recommended: 5-20 ms/div for AC signals
     holdoff_ms: Trigger holdoff time in milliseconds (default: 5)
                 Time to wait after trigger before next trigger
+    flush_s: Also hand buffered measurements to the workbook writer once they
+             are this many seconds old (default: 30), whichever comes first
 
 Example:
-    # Use all defaults (TCPIP::192.168.2.60::INSTR, 10, 5ms/div, 5ms holdoff)
+    # Use all defaults (TCPIP::192.168.2.60::INSTR, 1000, 5ms/div, 5ms holdoff, 30 s)
     python PAPABIN_dsox4034a_vrms-fast.py
 
     # Custom resource string
@@ -37,56 +48,121 @@ Example:
     python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR" 50
 
     # All custom parameters
-    python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR" 10 5 5
+    python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR" 1000 5 5 30
 """
 
 import sys
+import csv
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Deque
 import threading
 import signal
+from collections import deque
 
-from openpyxl import Workbook, load_workbook
+import numpy as np
 from instruments.keysight.dsox4034a import DSOX4034A
 
 
+# Final stretch before each deadline that is busy-waited instead of slept
+SPIN_THRESHOLD = 0.001  # seconds
+
+
+def _begin_timer_period(period_ms: int) -> Optional[int]:
+    """Request a finer system timer resolution (Windows only).
+
+    Returns the period to pass to _end_timer_period(), or None if unchanged.
+    """
+    if sys.platform != 'win32':
+        return None
+    try:
+        import ctypes
+        if ctypes.windll.winmm.timeBeginPeriod(period_ms) == 0:
+            return period_ms
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def _end_timer_period(period_ms: Optional[int]) -> None:
+    """Restore the timer resolution requested by _begin_timer_period()."""
+    if period_ms is None:
+        return
+    import ctypes
+    ctypes.windll.winmm.timeEndPeriod(period_ms)
+
+
 class FastVrmsLogger:
     """Fast real-time Vrms data logger using scope's built-in measurements."""
 
+    # Scope Vrms query, encoded once for the measurement loop
+    VRMS_QUERY = b":MEAS:VRMS? CHAN1\n"
+
+    # Column widths for the XLSX sheet (Timestamp, Vrms, ms, hr)
+    COLUMN_WIDTHS = (20, 15, 20, 20)
+
+    # Initial sample capacity of the column arrays (doubled when full)
+    INITIAL_CAPACITY = 65536
+
     def __init__(self, resource_string: str, results_dir: str = "results",
                  save_interval: int = 50, timebase_scale: float = 0.01,
-                 holdoff_time: float = 0.02):
+                 holdoff_time: float = 0.02, flush_seconds: float = 30.0):
         """
         Initialize the fast Vrms logger.
 
         Args:
             resource_string: VISA resource string for the oscilloscope
             results_dir: Directory to save result files (default: "results")
-            save_interval: Number of measurements before saving to disk (default: 50)
+            save_interval: Most measurements buffered before they are handed to
+                the workbook writer (default: 50)
             timebase_scale: Oscilloscope timebase in seconds/div (default: 0.01 = 10ms/div)
                            Shorter timebase = faster measurements
                            Recommended: 0.005 (5ms/div) to 0.02 (20ms/div) for AC signals
             holdoff_time: Trigger holdoff time in seconds (default: 0.02 = 20ms)
+            flush_seconds: Maximum age in seconds of buffered measurements; the buffer
+                is flushed at save_interval rows or after this long, whichever
+                comes first (default: 30)
         """
         self.resource_string = resource_string
         self.results_dir = Path(results_dir)
         self.save_interval = save_interval
         self.timebase_scale = timebase_scale
         self.holdoff_time = holdoff_time
+        self.flush_seconds = flush_seconds
+        self._last_flush = time.monotonic()
         self.scope = None
         self.workbook = None
         self.worksheet = None
+        self._use_xlsxwriter = False
         self.main_file_path = None
         self.final_file_path = None
         self.running = False
         self.data_lock = threading.Lock()
-        self.row_index = 2
+        self.headers: List[str] = []
         self.start_time = None
+        self._wall_start = None  # time.time() at start, for timestamps
+        self._t0_ns = None       # time.monotonic_ns() at start, for elapsed time
         self.last_copy_time = None
         self.measurement_count = 0
-        self.data_buffer: List[Tuple[str, float, float, float]] = []
+        # Raw samples (elapsed_ms, vrms); timestamps are formatted on flush.
+        # Single producer (measurement loop) / single consumer (writer thread):
+        # deque append/popleft are atomic, so the hot path takes no lock
+        self.data_buffer: Deque[Tuple[float, float]] = deque()
+
+        # Writer thread: workbook rows and FINAL snapshots are written there so
+        # disk I/O never delays a sample
+        self._flush_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._checkpoint_event = threading.Event()
+        self._stop_requested = False
+
+        # All samples written so far, used to rebuild the FINAL snapshot
+        # (the streaming worksheet does not keep rows in memory). Stored as
+        # preallocated column arrays; timestamps are derived from elapsed_ms
+        self._ms = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._vrms = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._n = 0
 
         self.results_dir.mkdir(exist_ok=True)
 
@@ -138,8 +214,9 @@ class FastVrmsLogger:
         # This makes the scope display and continuously update VRMS
         self.scope.write(":MEAS:VRMS CHAN1")
 
-        # Turn off statistics to speed up (we don't need min/max/avg/stddev)
-        self.scope.write(":MEAS:STAT OFF")
+        # Hide the statistics panel (we don't need min/max/avg/stddev);
+        # :MEAS:STAT has no OFF setting, only the display can be turned off
+        self.scope.write(":MEAS:STAT:DISP OFF")
 
         # Wait a moment for measurement to stabilize
         time.sleep(0.5)
@@ -165,29 +242,57 @@ class FastVrmsLogger:
 
     def setup_excel_files(self) -> None:
         """Create and initialize Excel files for data logging."""
-        self.start_time = datetime.now()
+        self._wall_start = time.time()
+        self._t0_ns = time.monotonic_ns()
+        self.start_time = datetime.fromtimestamp(self._wall_start)
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
 
         self.main_file_path = self.results_dir / f"Result_{timestamp}.xlsx"
-        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.xlsx"
-
-        self.workbook = Workbook()
-        self.worksheet = self.workbook.active
-        self.worksheet.title = "Vrms Data"
+        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.csv"
 
-        self.worksheet.append(["Timestamp", "Vrms (V)", "Elapsed Time (ms)", "Elapsed Time (hr)"])
-        self.worksheet.column_dimensions['A'].width = 20
-        self.worksheet.column_dimensions['B'].width = 15
-        self.worksheet.column_dimensions['C'].width = 20
-        self.worksheet.column_dimensions['D'].width = 20
+        self.headers = ["Timestamp", "Vrms (V)", "Elapsed Time (ms)", "Elapsed Time (hr)"]
+        self._create_workbook()
 
-        self.workbook.save(self.main_file_path)
         self.copy_to_final()
 
-        print(f"Created Excel files:")
-        print(f"  Main file: {self.main_file_path}")
+        print(f"Created result files:")
+        print(f"  Main file: {self.main_file_path} (written when logging stops)")
         print(f"  FINAL file: {self.final_file_path}")
-        print(f"  Save interval: every {self.save_interval} measurements")
+        print(f"  Save interval: every {self.save_interval} measurements or {self.flush_seconds:g} s")
+
+    def _create_workbook(self) -> None:
+        """
+        Open the streaming workbook and write the header row.
+
+        Uses xlsxwriter in constant_memory mode when it is installed (rows are
+        flushed to disk as they are written, faster than openpyxl), otherwise an
+        openpyxl write-only workbook. Either way the file is finished once, in close().
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+
+        self._use_xlsxwriter = xlsxwriter is not None
+        if self._use_xlsxwriter:
+            self.workbook = xlsxwriter.Workbook(str(self.main_file_path), {'constant_memory': True})
+            self.worksheet = self.workbook.add_worksheet("Vrms Data")
+            for col, width in enumerate(self.COLUMN_WIDTHS):
+                self.worksheet.set_column(col, col, width)
+            self.worksheet.write_row(0, 0, self.headers)
+            return
+
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet("Vrms Data")
+
+        # Column widths must be set before any row is appended
+        for col, width in enumerate(self.COLUMN_WIDTHS, 1):
+            self.worksheet.column_dimensions[get_column_letter(col)].width = width
+
+        self.worksheet.append(self.headers)
 
     def read_vrms_fast(self) -> Optional[float]:
         """
@@ -199,60 +304,156 @@ class FastVrmsLogger:
         """
         try:
             # Query the displayed VRMS result (should be fast)
-            # This reads the current value without triggering a new acquisition
-            vrms_str = self.scope.query(":MEAS:VRMS? CHAN1")
-            vrms = float(vrms_str)
+            # This reads the current value without triggering a new acquisition;
+            # naming the measurement and source keeps the value unambiguous
+            # whatever else is shown on the scope
+            self.scope.write_raw(self.VRMS_QUERY)
+            vrms = float(self.scope.read_raw())
             return vrms
         except Exception as e:
             print(f"Error reading Vrms: {e}")
             return None
 
-    def buffer_data(self, timestamp_str: str, vrms: float, elapsed_ms: float) -> None:
-        """Add data to buffer and flush when full."""
-        with self.data_lock:
-            elapsed_hr = elapsed_ms / 3_600_000  # Convert ms to hours
-            self.data_buffer.append((timestamp_str, vrms, elapsed_ms, elapsed_hr))
-            self.measurement_count += 1
-
-            if len(self.data_buffer) >= self.save_interval:
+    def format_timestamp(self, elapsed_ms: float) -> str:
+        """Format the wall-clock time of a sample as HH:MM:SS:mmm."""
+        t = self._wall_start + elapsed_ms / 1000
+        return time.strftime("%H:%M:%S", time.localtime(t)) + f":{int(t * 1000) % 1000:03d}"
+
+    def buffer_data(self, vrms: float, elapsed_ms: float) -> None:
+        """Queue a sample and flush once the buffer is full or old enough."""
+        self.data_buffer.append((elapsed_ms, vrms))
+        self.measurement_count += 1
+
+        if (len(self.data_buffer) >= self.save_interval
+                or time.monotonic() - self._last_flush >= self.flush_seconds):
+            if self._writer is not None:
+                self._flush_event.set()
+            else:
                 self.flush_buffer()
 
     def flush_buffer(self) -> None:
-        """Write buffered data to Excel file."""
+        """Append buffered rows to the streaming worksheet (no workbook save)."""
+        self._last_flush = time.monotonic()
         if not self.data_buffer:
             return
 
         try:
-            for timestamp_str, vrms, elapsed_ms, elapsed_hr in self.data_buffer:
-                self.worksheet.cell(row=self.row_index, column=1, value=timestamp_str)
-                self.worksheet.cell(row=self.row_index, column=2, value=vrms)
-                self.worksheet.cell(row=self.row_index, column=3, value=elapsed_ms)
-                self.worksheet.cell(row=self.row_index, column=4, value=elapsed_hr)
-                self.row_index += 1
-
-            self.workbook.save(self.main_file_path)
-            self.data_buffer.clear()
+            n = self._n
+            end = n + len(self.data_buffer)
+            if end > len(self._ms):
+                capacity = max(end, 2 * len(self._ms))
+                self._ms = np.resize(self._ms, capacity)
+                self._vrms = np.resize(self._vrms, capacity)
+
+            popleft = self.data_buffer.popleft
+            ms_col = self._ms
+            vrms_col = self._vrms
+            for i in range(n, end):
+                ms_col[i], vrms_col[i] = popleft()
+            self._n = end
+
+            if self._use_xlsxwriter:
+                # xlsxwriter: sample i goes on row i + 1 (row 0 is the header)
+                write_row = self.worksheet.write_row
+                for row_index, row in enumerate(self.iter_rows(n, end), n + 1):
+                    write_row(row_index, 0, row)
+            else:
+                append = self.worksheet.append
+                for row in self.iter_rows(n, end):
+                    append(row)
 
         except Exception as e:
             print(f"Error flushing buffer: {e}")
 
+    def iter_rows(self, start: int = 0, stop: Optional[int] = None):
+        """Yield (timestamp, vrms, elapsed_ms, elapsed_hr) rows from the column arrays."""
+        if stop is None:
+            stop = self._n
+        return self._format_rows(self._ms[start:stop], self._vrms[start:stop])
+
+    def _format_rows(self, ms: np.ndarray, vrms: np.ndarray):
+        """Yield (timestamp, vrms, elapsed_ms, elapsed_hr) rows for the given samples."""
+        hr = ms / 3_600_000  # Convert ms to hours
+        format_timestamp = self.format_timestamp
+        for elapsed_ms, value, elapsed_hr in zip(ms.tolist(), vrms.tolist(), hr.tolist()):
+            yield (format_timestamp(elapsed_ms), value, elapsed_ms, elapsed_hr)
+
+    def _snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Views of the samples flushed so far.
+
+        Rows below _n are never rewritten, and a resize allocates new arrays, so
+        the views stay valid while logging continues.
+        """
+        n = self._n
+        return self._ms[:n], self._vrms[:n]
+
     def copy_to_final(self) -> None:
-        """Copy the main file to the FINAL file."""
-        try:
-            with self.data_lock:
-                self.flush_buffer()
-                self.workbook.save(self.main_file_path)
+        """Update the FINAL CSV snapshot (queued to the writer thread if running)."""
+        self.last_copy_time = time.monotonic()
+
+        if self._writer is not None:
+            self._checkpoint_event.set()
+            self._flush_event.set()
+            return
 
-            wb_copy = load_workbook(self.main_file_path)
-            wb_copy.save(self.final_file_path)
-            wb_copy.close()
+        with self.data_lock:
+            self.flush_buffer()
+        self._write_final(*self._snapshot())
 
-            self.last_copy_time = time.time()
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Updated FINAL file ({self.measurement_count} measurements)")
+    def _write_final(self, ms: np.ndarray, vrms: np.ndarray) -> None:
+        """Write a snapshot of samples to the FINAL CSV file."""
+        try:
+            with open(self.final_file_path, 'w', newline='', encoding='utf-8-sig',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(self.headers)
+                writer.writerows(self._format_rows(ms, vrms))
+
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Updated FINAL file ({len(ms)} measurements)")
 
         except Exception as e:
             print(f"Error copying to FINAL file: {e}")
 
+    def _writer_loop(self) -> None:
+        """Writer thread: persist queued samples whenever the loop signals."""
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+
+            # Requests are set before the flush event, so they are visible after clear().
+            # The checkpoint event is only cleared when seen set: a request arriving
+            # after the check stays set for the next pass, one arriving before the
+            # clear is served by the FINAL write below
+            checkpoint = self._checkpoint_event.is_set()
+            if checkpoint:
+                self._checkpoint_event.clear()
+            stop = self._stop_requested
+
+            # Disk work happens here, acquisition keeps running
+            self.flush_buffer()
+
+            if checkpoint or stop:
+                self._write_final(*self._snapshot())
+            if stop:
+                return
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread."""
+        self._stop_requested = False
+        self._flush_event.clear()
+        self._writer = threading.Thread(target=self._writer_loop, name="xlsx-writer", daemon=True)
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        """Ask the writer to drain the queue and write FINAL, then wait for it."""
+        if self._writer is None:
+            return
+        self._stop_requested = True
+        self._flush_event.set()
+        self._writer.join()
+        self._writer = None
+
     def run(self) -> None:
         """Start the data logging loop with precise 100ms timing."""
         print("\n" + "="*60)
@@ -266,65 +467,78 @@ class FastVrmsLogger:
         print("="*60 + "\n")
 
         self.running = True
-        self.last_copy_time = time.time()
+        self.last_copy_time = time.monotonic()
 
         target_interval = 1  # 1s
-        next_measurement_time = time.time()
+        # perf_counter is monotonic too, and stays high-resolution on Windows
+        # before Python 3.13, where monotonic() ticks at ~15.6 ms
+        next_measurement_time = time.perf_counter()
+
+        self._start_writer()
+
+        # Raise the Windows timer resolution to 1 ms so time.sleep() wakes on time
+        timer_period = _begin_timer_period(1)
 
         try:
             while self.running:
-                now = datetime.now()
-                timestamp_str = now.strftime("%H:%M:%S") + f":{now.microsecond // 1000:03d}"
-
-                # Calculate elapsed time in milliseconds from start
-                elapsed_ms = (now - self.start_time).total_seconds() * 1000
+                # Elapsed time in milliseconds from start (monotonic clock);
+                # the timestamp string is derived from it only when needed
+                elapsed_ms = (time.monotonic_ns() - self._t0_ns) / 1e6
 
                 # Read the continuously-updated VRMS (should be fast!)
                 vrms = self.read_vrms_fast()
 
                 if vrms is not None:
-                    self.buffer_data(timestamp_str, vrms, elapsed_ms)
-                    print(f"{timestamp_str} | {vrms:.6f} V | {elapsed_ms:.1f} ms")
+                    self.buffer_data(vrms, elapsed_ms)
+                    print(f"{self.format_timestamp(elapsed_ms)} | {vrms:.6f} V | {elapsed_ms:.1f} ms")
 
                 # Check if 5 minutes have passed
-                if time.time() - self.last_copy_time >= 300:
+                if time.monotonic() - self.last_copy_time >= 300:
                     self.copy_to_final()
 
-                # Precise timing
+                # Precise timing: sleep until ~1 ms before the deadline,
+                # then spin for the remainder
                 next_measurement_time += target_interval
-                sleep_time = next_measurement_time - time.time()
+                sleep_time = next_measurement_time - time.perf_counter()
 
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    if sleep_time > SPIN_THRESHOLD:
+                        time.sleep(sleep_time - SPIN_THRESHOLD)
+                    while time.perf_counter() < next_measurement_time:
+                        pass
                 else:
                     if sleep_time < -target_interval:
                         print(f"Warning: Running {-sleep_time:.3f}s behind schedule")
-                        next_measurement_time = time.time()
+                        next_measurement_time = time.perf_counter()
 
         except KeyboardInterrupt:
             print("\n\nStopping data logging...")
             self.running = False
 
         finally:
-            print("Flushing buffered data...")
-            with self.data_lock:
-                self.flush_buffer()
-
-            print("Saving final data...")
-            self.copy_to_final()
+            _end_timer_period(timer_period)
+            print("Flushing buffered data and saving final data...")
+            self._stop_writer()
             print("Data logging completed!")
             print(f"Total measurements: {self.measurement_count}")
 
     def close(self) -> None:
-        """Close all resources."""
+        """Finish the workbook (a streaming workbook can only be saved once)."""
         if self.workbook:
             with self.data_lock:
                 try:
                     self.flush_buffer()
-                    self.workbook.save(self.main_file_path)
-                    self.workbook.close()
+                    if self._use_xlsxwriter:
+                        self.workbook.close()
+                    else:
+                        # One large buffered handle instead of many small zip writes
+                        with open(self.main_file_path, 'wb', buffering=1 << 20) as f:
+                            self.workbook.save(f)
+                    print(f"Saved Excel file: {self.main_file_path}")
                 except Exception as e:
                     print(f"Error closing workbook: {e}")
+                finally:
+                    self.workbook = None
 
 
 def signal_handler(signum, frame):
@@ -337,24 +551,26 @@ def main():
     """Main entry point."""
     # Default values
     default_resource = "TCPIP::192.168.2.73::INSTR"
-    default_save_interval = 10
+    default_save_interval = 1000
     default_timebase_ms = 5
     default_holdoff_ms = 5
+    default_flush_s = 30
 
     # Show help if requested
     if len(sys.argv) >= 2 and sys.argv[1] in ['-h', '--help']:
         print("Usage:")
-        print("  python PAPABIN_dsox4034a_vrms-fast.py [RESOURCE_STRING] [save_interval] [timebase_ms] [holdoff_ms]")
+        print("  python PAPABIN_dsox4034a_vrms-fast.py [RESOURCE_STRING] [save_interval] [timebase_ms] [holdoff_ms] [flush_s]")
         print("\nArguments:")
         print(f"  RESOURCE_STRING: VISA resource string (default: {default_resource})")
-        print(f"  save_interval: Number of measurements before saving (default: {default_save_interval})")
+        print(f"  save_interval: Max measurements per workbook write (default: {default_save_interval})")
         print(f"  timebase_ms: Timebase in ms/div (default: {default_timebase_ms})")
         print("               Shorter = faster, Recommended: 5-20 ms/div")
         print(f"  holdoff_ms: Trigger holdoff in ms (default: {default_holdoff_ms})")
+        print(f"  flush_s: Max seconds between workbook writes (default: {default_flush_s})")
         print("\nExamples:")
         print('  python PAPABIN_dsox4034a_vrms-fast.py')
         print('  python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR"')
-        print('  python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR" 10 5 5')
+        print('  python PAPABIN_dsox4034a_vrms-fast.py "TCPIP::192.168.2.60::INSTR" 1000 5 5 30')
         sys.exit(0)
 
     # Parse resource_string (argument 1)
@@ -388,17 +604,26 @@ def main():
         except ValueError:
             print(f"Warning: Invalid holdoff_ms '{sys.argv[4]}', using default: {default_holdoff_ms} ms")
 
+    # Parse flush_s (argument 5)
+    flush_seconds = default_flush_s
+    if len(sys.argv) >= 6:
+        try:
+            flush_seconds = float(sys.argv[5])
+        except ValueError:
+            print(f"Warning: Invalid flush_s '{sys.argv[5]}', using default: {default_flush_s} s")
+
     # Print configuration
     print(f"Configuration:")
     print(f"  Resource: {resource_string}")
-    print(f"  Save interval: {save_interval}")
     print(f"  Timebase: {timebase_scale*1000:.1f} ms/div")
     print(f"  Holdoff: {holdoff_time*1000:.1f} ms")
+    print(f"  Flush: every {save_interval} measurements or {flush_seconds:g} s")
 
     signal.signal(signal.SIGINT, signal_handler)
 
     logger = FastVrmsLogger(resource_string, save_interval=save_interval,
-                           timebase_scale=timebase_scale, holdoff_time=holdoff_time)
+                           timebase_scale=timebase_scale, holdoff_time=holdoff_time,
+                           flush_seconds=flush_seconds)
 
     try:
         logger.connect()
@@ -52,13 +52,12 @@ class DCVoltageLogger(BaseDataLogger):
         """Connect and configure the DMM."""
         self.dmm = A34405A(self.resource_string)
         self.dmm.connect()
+        print(f"Connected to: {self.dmm.identify()}")
 
-        # Configure for DC voltage measurement in auto-range
+        # Configure for DC voltage measurement in auto-range, with the trigger
+        # source set to immediate for fast continuous readings (one message)
         print("Configuring DC voltage measurement (auto-range)...")
-        self.dmm.configure_dc_voltage()
-
-        # Set trigger source to immediate for fast continuous readings
-        self.dmm.set_trigger_source("IMM")
+        self.dmm.configure_dc_voltage(trigger_source="IMM")
 
         print(f"  Mode: DC Voltage (auto-range)")
         print(f"  Trigger: Immediate")
@@ -15,6 +15,9 @@ Date: 2025-12-05
 import sys
 import os
 import time
+import traceback
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -60,14 +63,16 @@ def basic_usage_example():
         temps = temp_meter.read_all_channels()
         print(f"   All channels: {temps}")
 
-        # Read specific channels
-        print("\n6. Reading individual channels...")
-        for i in range(1, 9):
-            temp = temp_meter.read_channel(i)
-            if temp is not None and temp > -100000:
-                print(f"   Channel {i}: {temp:.1f}°C")
-            else:
+        # Per-channel status from the same reading (one query for all 8);
+        # None and the large negative values of disabled channels become NaN
+        print("\n6. Per-channel status...")
+        arr = np.array(temps, dtype=np.float64)
+        arr[arr <= -100000] = np.nan
+        for i, temp in enumerate(arr, 1):
+            if np.isnan(temp):
                 print(f"   Channel {i}: Disabled or Error")
+            else:
+                print(f"   Channel {i}: {temp:.1f}°C")
 
         # Check for errors
         print("\n7. Checking for errors...")
@@ -76,7 +81,6 @@ def basic_usage_example():
 
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
 
     finally:
@@ -89,8 +93,20 @@ def basic_usage_example():
     print("=" * 60)
 
 
-def continuous_monitoring_example():
-    """Example: Continuously monitor temperature from all channels."""
+def continuous_monitoring_example(min_interval=0.5, max_interval=5.0, change_threshold=0.2):
+    """
+    Example: Continuously monitor temperature from all channels.
+
+    The poll interval adapts to the readings: it halves (down to min_interval)
+    when any channel moves by more than change_threshold degrees, and grows by
+    1.5x (up to max_interval) while all channels are steady. Transitions are
+    caught quickly without polling a stable setup every half second.
+
+    Args:
+        min_interval: Shortest time between readings in seconds (default: 0.5)
+        max_interval: Longest time between readings in seconds (default: 5.0)
+        change_threshold: Change in degrees that counts as activity (default: 0.2)
+    """
     print("=" * 60)
     print("AT4516 Continuous Monitoring Example")
     print("=" * 60)
@@ -110,8 +126,12 @@ def continuous_monitoring_example():
         print("\nTimestamp        Ch1     Ch2     Ch3     Ch4     Ch5     Ch6     Ch7     Ch8")
         print("-" * 90)
 
+        interval = min_interval
+        last_temps = None
+        next_read = time.monotonic()
+
         while True:
-            # Read all channels
+            # Read all channels (one FETCH? transaction returns all 8 values)
             temps = temp_meter.read_all_channels()
 
             # Format timestamp
@@ -128,15 +148,28 @@ def continuous_monitoring_example():
             # Print results
             print(f"{timestamp}    " + "  ".join(temp_strs))
 
-            # Wait before next reading
-            time.sleep(1.0)
+            # Adapt the poll interval to how much the readings moved
+            if last_temps is not None:
+                changed = any(
+                    new is not None and old is not None and abs(new - old) > change_threshold
+                    for new, old in zip(temps, last_temps)
+                )
+                if changed:
+                    interval = max(min_interval, interval / 2)
+                else:
+                    interval = min(max_interval, interval * 1.5)
+            last_temps = temps
+
+            # Wait before next reading; the deadline includes the FETCH? round
+            # trip, so the interval is not stretched by the query time
+            next_read += interval
+            time.sleep(max(0.0, next_read - time.monotonic()))
 
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user")
 
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
 
     finally:
@@ -163,6 +196,11 @@ def comparator_example():
         # Configure instrument (use helper method)
         temp_meter.configure_and_start(tc_type='TC-K', rate='FAST', unit='CEL')
 
+        # Per-channel limits: 20-30°C on every channel, 22-28°C on Channel 1
+        low_limits = np.full(8, 20.0)
+        high_limits = np.full(8, 30.0)
+        low_limits[0], high_limits[0] = 22.0, 28.0
+
         # Set temperature limits
         print("\n1. Setting temperature limits...")
         temp_meter.set_low_limit(20.0)   # Low limit: 20°C
@@ -172,10 +210,10 @@ def comparator_example():
 
         # Set specific limits for Channel 1
         print("\n2. Setting Channel 1 specific limits...")
-        temp_meter.set_channel_low_limit(1, 22.0)
-        temp_meter.set_channel_high_limit(1, 28.0)
-        print("   Channel 1 Low: 22.0°C")
-        print("   Channel 1 High: 28.0°C")
+        temp_meter.set_channel_low_limit(1, low_limits[0])
+        temp_meter.set_channel_high_limit(1, high_limits[0])
+        print(f"   Channel 1 Low: {low_limits[0]:.1f}°C")
+        print(f"   Channel 1 High: {high_limits[0]:.1f}°C")
 
         # Enable comparator
         print("\n3. Enabling comparator...")
@@ -189,21 +227,17 @@ def comparator_example():
 
         # Read temperatures
         print("\n5. Reading temperatures (comparator active)...")
-        temps = temp_meter.read_all_channels()
-        for i, temp in enumerate(temps, start=1):
-            if temp is not None:
-                status = ""
-                if temp < 20.0:
-                    status = " [BELOW LOW LIMIT]"
-                elif temp > 30.0:
-                    status = " [ABOVE HIGH LIMIT]"
-                else:
-                    status = " [OK]"
-                print(f"   Channel {i}: {temp:.1f}°C {status}")
+        # Disabled channels (None) become NaN and are skipped
+        temps = np.array(temp_meter.read_all_channels(), dtype=np.float64)
+        n = len(temps)
+        status = np.where(temps < low_limits[:n], "[BELOW LOW LIMIT]",
+                          np.where(temps > high_limits[:n], "[ABOVE HIGH LIMIT]", "[OK]"))
+        for i, (temp, flag) in enumerate(zip(temps, status), start=1):
+            if not np.isnan(temp):
+                print(f"   Channel {i}: {temp:.1f}°C  {flag}")
 
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
 
     finally:
@@ -222,10 +256,10 @@ def context_manager_example():
         # Configure instrument (use helper method)
         temp_meter.configure_and_start(tc_type='TC-K', rate='FAST', unit='CEL')
 
-        # Read temperatures
+        # Read temperatures (one FETCH? for all channels, not one query per channel)
         print("\nReading temperatures:")
-        for i in range(1, 9):
-            temp = temp_meter.read_channel(i)
+        temps = temp_meter.read_all_channels()
+        for i, temp in enumerate(temps, start=1):
             if temp is not None:
                 print(f"  Channel {i}: {temp:.1f}°C")
 
@@ -92,9 +92,11 @@ def channel_configuration_example():
         scope.set_channel_offset(1, 0.0)  # 0V offset
         scope.set_channel_coupling(1, 'DC')
 
-        print(f"Channel 1 scale: {scope.get_channel_scale(1)} V/div")
-        print(f"Channel 1 offset: {scope.get_channel_offset(1)} V")
-        print(f"Channel 1 coupling: {scope.get_channel_coupling(1)}")
+        # Read all three back in one query
+        settings = scope.get_channel_settings(1)
+        print(f"Channel 1 scale: {settings['scale']} V/div")
+        print(f"Channel 1 offset: {settings['offset']} V")
+        print(f"Channel 1 coupling: {settings['coupling']}")
 
         # Configure timebase
         scope.set_timebase_scale(100e-6)  # 100 µs/div
@@ -140,9 +142,10 @@ def waveform_acquisition_example():
         scope.set_timebase_scale(1e-3)  # 1 ms/div
         scope.set_channel_scale(1, 1.0)  # 1 V/div
 
-        # Perform single acquisition
+        # Perform single acquisition and wait for it with one *OPC? query
+        # (10 div x 1 ms/div; allow extra time for the trigger)
         print("Acquiring waveform...")
-        scope.single()
+        scope.digitize([1], wait=True, timeout_ms=10000)
 
         # Get waveform data (1000 points)
         time, voltage = scope.get_waveform(channel=1, points=1000)
@@ -241,12 +244,11 @@ def multi_channel_example():
 
         # Acquire waveforms from multiple channels
         print("\nAcquiring waveforms from all channels...")
-        scope.digitize([1, 2, 3, 4])
+        scope.digitize([1, 2, 3, 4], wait=True, timeout_ms=10000)
 
-        waveforms = {}
-        for ch in [1, 2, 3, 4]:
-            time, voltage = scope.get_waveform(channel=ch, points=500)
-            waveforms[ch] = (time, voltage)
+        # Transfer settings are sent once for all four channels
+        waveforms = scope.get_waveforms([1, 2, 3, 4], points=500)
+        for ch, (time, voltage) in waveforms.items():
             print(f"Channel {ch}: {len(voltage)} points, "
                   f"avg = {np.mean(voltage):.3f} V")
 
@@ -257,9 +259,8 @@ def list_resources_example():
     print("Available VISA Resources")
     print("=" * 60)
 
-    import pyvisa
-    rm = pyvisa.ResourceManager('@py')
-    resources = rm.list_resources()
+    from instruments import get_resource_manager
+    resources = get_resource_manager().list_resources()
 
     if resources:
         print(f"Found {len(resources)} resource(s):")
@@ -268,8 +269,6 @@ def list_resources_example():
     else:
         print("No VISA resources found")
 
-    rm.close()
-
 
 if __name__ == "__main__":
     """
@@ -20,6 +20,8 @@ Usage via Python import:
 from instruments.keysight.dsox4034a import DSOX4034A
 import sys
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import vrms_logger
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -55,7 +57,6 @@ def example_usage():
 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
         traceback.print_exc()
 
     finally:
@@ -68,29 +69,40 @@ def find_oscilloscope():
     """
     Helper function to find connected oscilloscopes.
     """
-    import pyvisa
+    from instruments import get_resource_manager
 
     print("Searching for connected instruments...")
 
     try:
-        rm = pyvisa.ResourceManager('@py')
+        rm = get_resource_manager()
         resources = rm.list_resources()
 
-        print(f"\nFound {len(resources)} instrument(s):")
-        for resource in resources:
-            print(f"  - {resource}")
-
-            # Try to identify
+        def identify(resource):
+            """Return the *IDN? reply of a resource, or None if it does not answer."""
             try:
                 inst = rm.open_resource(resource)
-                inst.timeout = 2000
-                idn = inst.query("*IDN?")
-                print(f"    ID: {idn.strip()}")
-                inst.close()
-            except:
-                print(f"    (Could not identify)")
+                try:
+                    inst.timeout = 2000
+                    return inst.query("*IDN?").strip()
+                finally:
+                    inst.close()
+            except Exception:
+                return None
+
+        # Probe all resources at once, so the scan waits for one 2 s timeout
+        # instead of one per silent resource
+        idns = []
+        if resources:
+            with ThreadPoolExecutor(max_workers=min(16, len(resources))) as pool:
+                idns = list(pool.map(identify, resources))
 
-        rm.close()
+        print(f"\nFound {len(resources)} instrument(s):")
+        for resource, idn in zip(resources, idns):
+            print(f"  - {resource}")
+            if idn:
+                print(f"    ID: {idn}")
+            else:
+                print(f"    (Could not identify)")
 
     except Exception as e:
         print(f"Error: {e}")
@@ -6,15 +6,62 @@ via USB, Ethernet, RS-232, or other communication interfaces using VISA,
 Serial, and other protocols.
 """
 
+import atexit
+from functools import lru_cache
+
 __version__ = "0.1.0"
 __author__ = "Lab Team"
 
-# Import base classes
-from .base_logger import BaseDataLogger
 
-# Import instrument modules here as they are added
-# from .keysight import DSOX4034A
-# from .agilent import A34405A
-# from .anbai import AT4516
+def get_resource_manager(backend='@py'):
+    """
+    Return the shared ResourceManager for a PyVISA backend.
+
+    Created on first use and closed at interpreter exit. Drivers and examples
+    share it instead of opening (and closing) their own, so disconnecting one
+    instrument never closes another instrument's session.
+
+    Args:
+        backend: '@py' for pyvisa-py (default), '@ivi' for an installed VISA
+                 library (NI-VISA / Keysight IO Libraries, faster USB-TMC),
+                 or None to use the installed VISA library when there is one
+                 and fall back to pyvisa-py
+    """
+    if backend is None:
+        # Resolve auto-detection first, so None shares the entry of the backend it picks
+        from pyvisa.ctwrapper import IVIVisaLibrary
+        if IVIVisaLibrary.get_library_paths():
+            try:
+                return _resource_manager('@ivi')
+            except (OSError, ValueError):  # VISA library found but cannot be loaded
+                pass
+        backend = '@py'
+
+    # Always call the cache with a positional string, so get_resource_manager()
+    # and get_resource_manager('@py') share one entry
+    return _resource_manager(backend)
+
+
+# One entry per backend ('@py', '@ivi'), so the cache stays a few items long
+@lru_cache(maxsize=None)
+def _resource_manager(backend):
+    """Open the ResourceManager for a backend and close it at exit (once per backend)."""
+    import pyvisa
+    rm = pyvisa.ResourceManager(backend)
+    atexit.register(rm.close)
+    return rm
+
+# Instrument modules are imported from their vendor packages as needed:
+# from instruments.keysight import DSOX4034A
+# from instruments.agilent import A34405A
+# from instruments.anbai import AT4516
+
+__all__ = ['BaseDataLogger', 'get_resource_manager']
+
 
-__all__ = ['BaseDataLogger']
+def __getattr__(name):
+    # Import the base logger on first use only
+    if name == 'BaseDataLogger':
+        from .base_logger import BaseDataLogger
+        return BaseDataLogger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,12 @@ Agilent Instruments Package
 This package provides Python modules for controlling Agilent instruments.
 """
 
-from .a34405a import A34405A
-
 __all__ = ['A34405A']
+
+
+def __getattr__(name):
+    # Import the driver (and its backend library) on first use only
+    if name == 'A34405A':
+        from .a34405a import A34405A
+        return A34405A
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,9 +16,15 @@ References:
     - Agilent 34405A Programmer's Reference
 """
 
+import asyncio
+import logging
 import pyvisa
-from typing import Optional, Tuple
-import time
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .. import get_resource_manager
+
+_log = logging.getLogger(__name__)
 
 
 class A34405A:
@@ -54,7 +60,19 @@ class A34405A:
     # Default VISA resource string for lab instrument
     DEFAULT_RESOURCE = "USB0::2391::1560::TW47310002::0::INSTR"
 
-    def __init__(self, resource_string: Optional[str] = None, timeout: int = 5000):
+    # Valid integration times (power line cycles) and trigger sources
+    VALID_NPLC = (0.02, 0.2, 1, 10, 100)
+    TRIGGER_SOURCES = ('IMM', 'BUS', 'EXT')
+
+    # Commands that return the trigger/sample/NPLC/auto-zero settings to
+    # their defaults, so cached values no longer apply
+    _CACHE_RESETS = (':CONF', ':MEAS', '*RST')
+
+    # Pre-encoded :READ? for read(), which loggers call once per sample
+    READ_QUERY = b":READ?\n"
+
+    def __init__(self, resource_string: Optional[str] = None, timeout: int = 5000,
+                 chunk_size: int = 1024 * 1024, backend: Optional[str] = '@py'):
         """
         Initialize the 34405A multimeter interface.
 
@@ -63,12 +81,22 @@ class A34405A:
                 USB format: "USB0::0x0957::0x0618::MY########::INSTR"
                 If None, uses the lab's default instrument
             timeout: Command timeout in milliseconds (default: 5000)
+            chunk_size: VISA read chunk size in bytes (default: 1 MiB, enough
+                        for a full 50000-reading :READ?/:FETC? in one read)
+            backend: PyVISA backend, see get_resource_manager() (default: '@py')
         """
         self.resource_string = resource_string or self.DEFAULT_RESOURCE
         self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.backend = backend
         self.instrument = None
         self._rm = None
 
+        # Last known value of settings written or read through this object,
+        # keyed by SCPI header; see clear_cache()
+        self._cache = {}
+        self._idn = None
+
     def connect(self) -> None:
         """
         Establish connection to the multimeter.
@@ -77,14 +105,23 @@ class A34405A:
             ConnectionError: If connection fails
         """
         try:
-            self._rm = pyvisa.ResourceManager('@py')  # Use pyvisa-py backend
+            self._rm = get_resource_manager(self.backend)
             self.instrument = self._rm.open_resource(self.resource_string)
             self.instrument.timeout = self.timeout
 
+            # Responses end with a newline, so reads stop there without extra scans
+            self.instrument.read_termination = '\n'
+            self.instrument.write_termination = '\n'
+            self.instrument.chunk_size = self.chunk_size
+            self._cache.clear()
+            self._idn = None
+
             # Clear status and reset error queue
             self.write("*CLS")
 
-            print(f"Connected to: {self.identify()}")
+            # *IDN? costs a round trip, only query it when it will be logged
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("Connected to: %s", self.identify())
 
         except Exception as e:
             raise ConnectionError(f"Failed to connect to instrument: {e}")
@@ -94,10 +131,9 @@ class A34405A:
         if self.instrument:
             self.instrument.close()
             self.instrument = None
-        if self._rm:
-            self._rm.close()
-            self._rm = None
-        print("Disconnected from multimeter")
+        # The ResourceManager is shared with other instruments, leave it open
+        self._rm = None
+        _log.debug("Disconnected from multimeter")
 
     def write(self, command: str) -> None:
         """
@@ -112,6 +148,8 @@ class A34405A:
         if not self.instrument:
             raise RuntimeError("Not connected to instrument. Call connect() first.")
         self.instrument.write(command)
+        if command.startswith(self._CACHE_RESETS):
+            self._cache.clear()
 
     def query(self, command: str) -> str:
         """
@@ -128,7 +166,165 @@ class A34405A:
         """
         if not self.instrument:
             raise RuntimeError("Not connected to instrument. Call connect() first.")
-        return self.instrument.query(command).strip()
+        response = self.instrument.query(command).strip()
+        if command.startswith(self._CACHE_RESETS):
+            self._cache.clear()
+        return response
+
+    def write_raw(self, data: bytes) -> None:
+        """
+        Write pre-encoded bytes to the instrument.
+
+        Use this in tight loops with a command that is encoded once, including
+        the trailing newline (e.g. b":READ?\\n").
+
+        Args:
+            data: Complete message as bytes
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        self.instrument.write_raw(data)
+
+    def read_raw(self) -> bytes:
+        """
+        Read a raw response from the instrument.
+
+        Returns:
+            Response bytes (including the termination character)
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        return self.instrument.read_raw()
+
+    async def aquery(self, command: str) -> str:
+        """
+        Query the instrument without blocking the asyncio event loop.
+
+        The blocking query() runs in the loop's default thread pool, so
+        several multimeters can be read concurrently with asyncio.gather();
+        the wall time is then the slowest round trip, not the sum. Each
+        instrument must only have one query in flight at a time.
+
+        Args:
+            command: SCPI query command string
+
+        Returns:
+            Response string from instrument
+
+        Example:
+            >>> v1, v2 = await asyncio.gather(dmm1.aread(), dmm2.aread())
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.query, command)
+
+    def write_batch(self, commands: List[str]) -> None:
+        """
+        Send several commands in one SCPI message.
+
+        The commands are joined with ';:' (each one restarts at the root of
+        the command tree) so they cost a single USB transfer instead of one
+        per command.
+
+        Args:
+            commands: List of SCPI commands (e.g. [':CONF:VOLT:DC', ':TRIG:SOUR IMM'])
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        message = ";:".join(command.lstrip(":") for command in commands)
+        self.write(f":{message}")
+        if any(command.startswith(self._CACHE_RESETS) for command in commands):
+            self._cache.clear()
+
+    def query_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several queries in one SCPI message and split the responses.
+
+        The queries are joined with ';:' so the meter answers them all in a
+        single round trip instead of one per query.
+
+        Args:
+            commands: List of SCPI query commands (e.g. [':TRIG:SOUR?', ':SAMP:COUN?'])
+
+        Returns:
+            List of response strings, one per command
+
+        Raises:
+            RuntimeError: If not connected or the response count does not match
+        """
+        message = ";:".join(command.lstrip(":") for command in commands)
+        responses = self.query(f":{message}").split(";")
+        if any(command.startswith(self._CACHE_RESETS) for command in commands):
+            self._cache.clear()
+        if len(responses) != len(commands):
+            raise RuntimeError(
+                f"Expected {len(commands)} responses, got {len(responses)}: {responses}"
+            )
+        return [response.strip() for response in responses]
+
+    def _measure(self, function: str, range_val: Optional[float],
+                 resolution: Optional[float]) -> float:
+        """Send :MEAS? for a function with optional range/resolution."""
+        if range_val is None:
+            return float(self.query(f":MEAS:{function}?"))
+        elif resolution is None:
+            return float(self.query(f":MEAS:{function}? {range_val}"))
+        else:
+            return float(self.query(f":MEAS:{function}? {range_val},{resolution}"))
+
+    def _configure(self, function: str, range_val: Optional[float],
+                   resolution: Optional[float], nplc: Optional[float] = None,
+                   autozero: Optional[bool] = None,
+                   trigger_source: Optional[str] = None) -> None:
+        """Send :CONF plus the optional settings as one compound command."""
+        if range_val is None:
+            commands = [f":CONF:{function}"]
+        elif resolution is None:
+            commands = [f":CONF:{function} {range_val}"]
+        else:
+            commands = [f":CONF:{function} {range_val},{resolution}"]
+
+        # :CONF resets these settings, so they must follow it
+        if nplc is not None:
+            if nplc not in self.VALID_NPLC:
+                raise ValueError(f"NPLC must be one of {list(self.VALID_NPLC)}")
+            commands.append(f":{function}:NPLC {nplc}")
+        if autozero is not None:
+            commands.append(f":ZERO:AUTO {'ON' if autozero else 'OFF'}")
+        if trigger_source is not None:
+            trigger_source = trigger_source.upper()
+            if trigger_source not in self.TRIGGER_SOURCES:
+                raise ValueError("Trigger source must be 'IMM', 'BUS', or 'EXT'")
+            commands.append(f":TRIG:SOUR {trigger_source}")
+
+        self.write_batch(commands)
+
+        # The :CONF above cleared the cache; keep what was just set
+        if nplc is not None:
+            self._cache[f":{function}:NPLC"] = float(nplc)
+        if autozero is not None:
+            self._cache[":ZERO:AUTO"] = bool(autozero)
+        if trigger_source is not None:
+            self._cache[":TRIG:SOUR"] = trigger_source
+
+    @staticmethod
+    def _parse_floats(response: str) -> np.ndarray:
+        """
+        Parse a comma-separated list of readings in one NumPy call.
+
+        Raises:
+            ValueError: If any reading is not a number
+        """
+        # The str -> float64 conversion of the split list runs in C, instead of
+        # a Python-level float() per reading, and unlike np.fromstring it raises
+        # on a malformed token instead of silently truncating the array
+        return np.array(response.split(','), dtype=np.float64)
 
     # ========== Instrument Identification ==========
 
@@ -136,15 +332,28 @@ class A34405A:
         """
         Query instrument identification.
 
+        The response is cached for the lifetime of the connection.
+
         Returns:
             Identification string (Manufacturer, Model, Serial, Firmware)
         """
-        return self.query("*IDN?")
+        if self._idn is None:
+            self._idn = self.query("*IDN?")
+        return self._idn
+
+    def clear_cache(self) -> None:
+        """
+        Forget cached settings so the next getter queries the instrument.
+
+        Needed after changing settings from the front panel or with raw
+        write() commands that the setters do not track.
+        """
+        self._cache.clear()
 
     def reset(self) -> None:
         """Reset the instrument to default settings."""
-        self.write("*RST")
-        time.sleep(1)  # Wait for reset to complete
+        # *OPC? answers once the reset has completed, so no fixed delay is needed
+        self.wait_complete(command="*RST")
 
     def clear_status(self) -> None:
         """Clear the status registers and error queue."""
@@ -174,28 +383,26 @@ class A34405A:
         Returns:
             DC voltage in volts
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:VOLT:DC?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:VOLT:DC? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:VOLT:DC? {range_val},{resolution}"))
+        return self._measure('VOLT:DC', range_val, resolution)
 
     def configure_dc_voltage(self, range_val: Optional[float] = None,
-                            resolution: Optional[float] = None) -> None:
+                            resolution: Optional[float] = None,
+                            nplc: Optional[float] = None, autozero: Optional[bool] = None,
+                            trigger_source: Optional[str] = None) -> None:
         """
         Configure DC voltage measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in volts (None for auto-range)
             resolution: Measurement resolution in volts
+            nplc: Integration time in power line cycles (None to leave unchanged)
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:VOLT:DC")
-        elif resolution is None:
-            self.write(f":CONF:VOLT:DC {range_val}")
-        else:
-            self.write(f":CONF:VOLT:DC {range_val},{resolution}")
+        self._configure('VOLT:DC', range_val, resolution, nplc=nplc,
+                        autozero=autozero, trigger_source=trigger_source)
 
     # ========== AC Voltage Measurements ==========
 
@@ -212,28 +419,25 @@ class A34405A:
         Returns:
             AC voltage in volts (RMS)
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:VOLT:AC?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:VOLT:AC? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:VOLT:AC? {range_val},{resolution}"))
+        return self._measure('VOLT:AC', range_val, resolution)
 
     def configure_ac_voltage(self, range_val: Optional[float] = None,
-                            resolution: Optional[float] = None) -> None:
+                            resolution: Optional[float] = None,
+                            autozero: Optional[bool] = None,
+                            trigger_source: Optional[str] = None) -> None:
         """
         Configure AC voltage measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in volts
             resolution: Measurement resolution in volts
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:VOLT:AC")
-        elif resolution is None:
-            self.write(f":CONF:VOLT:AC {range_val}")
-        else:
-            self.write(f":CONF:VOLT:AC {range_val},{resolution}")
+        self._configure('VOLT:AC', range_val, resolution,
+                        autozero=autozero, trigger_source=trigger_source)
 
     # ========== DC Current Measurements ==========
 
@@ -250,28 +454,26 @@ class A34405A:
         Returns:
             DC current in amps
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:CURR:DC?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:CURR:DC? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:CURR:DC? {range_val},{resolution}"))
+        return self._measure('CURR:DC', range_val, resolution)
 
     def configure_dc_current(self, range_val: Optional[float] = None,
-                            resolution: Optional[float] = None) -> None:
+                            resolution: Optional[float] = None,
+                            nplc: Optional[float] = None, autozero: Optional[bool] = None,
+                            trigger_source: Optional[str] = None) -> None:
         """
         Configure DC current measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in amps
             resolution: Measurement resolution in amps
+            nplc: Integration time in power line cycles (None to leave unchanged)
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:CURR:DC")
-        elif resolution is None:
-            self.write(f":CONF:CURR:DC {range_val}")
-        else:
-            self.write(f":CONF:CURR:DC {range_val},{resolution}")
+        self._configure('CURR:DC', range_val, resolution, nplc=nplc,
+                        autozero=autozero, trigger_source=trigger_source)
 
     # ========== AC Current Measurements ==========
 
@@ -288,28 +490,25 @@ class A34405A:
         Returns:
             AC current in amps (RMS)
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:CURR:AC?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:CURR:AC? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:CURR:AC? {range_val},{resolution}"))
+        return self._measure('CURR:AC', range_val, resolution)
 
     def configure_ac_current(self, range_val: Optional[float] = None,
-                            resolution: Optional[float] = None) -> None:
+                            resolution: Optional[float] = None,
+                            autozero: Optional[bool] = None,
+                            trigger_source: Optional[str] = None) -> None:
         """
         Configure AC current measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in amps
             resolution: Measurement resolution in amps
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:CURR:AC")
-        elif resolution is None:
-            self.write(f":CONF:CURR:AC {range_val}")
-        else:
-            self.write(f":CONF:CURR:AC {range_val},{resolution}")
+        self._configure('CURR:AC', range_val, resolution,
+                        autozero=autozero, trigger_source=trigger_source)
 
     # ========== Resistance Measurements ==========
 
@@ -326,28 +525,26 @@ class A34405A:
         Returns:
             Resistance in ohms
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:RES?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:RES? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:RES? {range_val},{resolution}"))
+        return self._measure('RES', range_val, resolution)
 
     def configure_resistance(self, range_val: Optional[float] = None,
-                            resolution: Optional[float] = None) -> None:
+                            resolution: Optional[float] = None,
+                            nplc: Optional[float] = None, autozero: Optional[bool] = None,
+                            trigger_source: Optional[str] = None) -> None:
         """
         Configure 2-wire resistance measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in ohms
             resolution: Measurement resolution in ohms
+            nplc: Integration time in power line cycles (None to leave unchanged)
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:RES")
-        elif resolution is None:
-            self.write(f":CONF:RES {range_val}")
-        else:
-            self.write(f":CONF:RES {range_val},{resolution}")
+        self._configure('RES', range_val, resolution, nplc=nplc,
+                        autozero=autozero, trigger_source=trigger_source)
 
     def measure_resistance_4wire(self, range_val: Optional[float] = None,
                                 resolution: Optional[float] = None) -> float:
@@ -361,28 +558,26 @@ class A34405A:
         Returns:
             Resistance in ohms
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:FRES?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:FRES? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:FRES? {range_val},{resolution}"))
+        return self._measure('FRES', range_val, resolution)
 
     def configure_resistance_4wire(self, range_val: Optional[float] = None,
-                                  resolution: Optional[float] = None) -> None:
+                                  resolution: Optional[float] = None,
+                                  nplc: Optional[float] = None, autozero: Optional[bool] = None,
+                                  trigger_source: Optional[str] = None) -> None:
         """
         Configure 4-wire resistance measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Measurement range in ohms
             resolution: Measurement resolution in ohms
+            nplc: Integration time in power line cycles (None to leave unchanged)
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:FRES")
-        elif resolution is None:
-            self.write(f":CONF:FRES {range_val}")
-        else:
-            self.write(f":CONF:FRES {range_val},{resolution}")
+        self._configure('FRES', range_val, resolution, nplc=nplc,
+                        autozero=autozero, trigger_source=trigger_source)
 
     # ========== Frequency Measurements ==========
 
@@ -398,28 +593,48 @@ class A34405A:
         Returns:
             Frequency in Hz
         """
-        if range_val is None and resolution is None:
-            return float(self.query(":MEAS:FREQ?"))
-        elif resolution is None:
-            return float(self.query(f":MEAS:FREQ? {range_val}"))
-        else:
-            return float(self.query(f":MEAS:FREQ? {range_val},{resolution}"))
+        return self._measure('FREQ', range_val, resolution)
 
     def configure_frequency(self, range_val: Optional[float] = None,
-                           resolution: Optional[float] = None) -> None:
+                           resolution: Optional[float] = None,
+                           autozero: Optional[bool] = None,
+                           trigger_source: Optional[str] = None) -> None:
         """
         Configure frequency measurement without triggering.
 
+        All settings are sent as one compound SCPI command.
+
         Args:
             range_val: Expected voltage range in volts
             resolution: Measurement resolution in Hz
+            autozero: Enable/disable auto-zero (None to leave unchanged)
+            trigger_source: 'IMM', 'BUS' or 'EXT' (None to leave unchanged)
         """
-        if range_val is None:
-            self.write(":CONF:FREQ")
-        elif resolution is None:
-            self.write(f":CONF:FREQ {range_val}")
-        else:
-            self.write(f":CONF:FREQ {range_val},{resolution}")
+        self._configure('FREQ', range_val, resolution,
+                        autozero=autozero, trigger_source=trigger_source)
+
+    # ========== Multiple Measurements ==========
+
+    def measure_many(self, commands: List[str]) -> List[float]:
+        """
+        Run several measurement queries in one round trip.
+
+        The queries are sent as one compound message (see query_batch()), so
+        e.g. DC voltage and DC current at the same bias point cost one
+        write/read instead of two. The meter still switches function and
+        settles between them; when the same functions are read repeatedly,
+        configure_*() once and use read() instead.
+
+        Args:
+            commands: Measurement queries (e.g. [':MEAS:VOLT:DC?', ':MEAS:CURR:DC?'])
+
+        Returns:
+            Measured values, one per command
+
+        Example:
+            >>> volts, amps = dmm.measure_many([':MEAS:VOLT:DC?', ':MEAS:CURR:DC?'])
+        """
+        return [float(response) for response in self.query_batch(commands)]
 
     # ========== Continuity and Diode ==========
 
@@ -455,17 +670,71 @@ class A34405A:
         """
         Trigger a measurement and read the result.
 
-        Uses the currently configured measurement function.
+        Uses the currently configured measurement function. The query is
+        sent pre-encoded and the reply parsed from bytes, skipping PyVISA's
+        per-call string encoding and decoding.
 
         Returns:
             Measurement value
         """
-        return float(self.query(":READ?"))
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        self.instrument.write_raw(self.READ_QUERY)
+        return float(self.instrument.read_raw())
+
+    async def aread(self) -> float:
+        """
+        Trigger a measurement and read the result without blocking the event loop.
+
+        See aquery() for how several instruments are read concurrently.
+
+        Returns:
+            Measurement value
+        """
+        return float(await self.aquery(":READ?"))
 
     def initiate(self) -> None:
         """Initiate a measurement (trigger)."""
         self.write(":INIT")
 
+    def wait_complete(self, timeout_ms: Optional[int] = None,
+                      command: Optional[str] = None) -> None:
+        """
+        Block until all pending operations are complete using *OPC?.
+
+        The meter answers *OPC? only when the preceding operations (e.g. the
+        readings started by initiate()) have finished, so this is one
+        blocking wait instead of a polling loop. When command is given it is
+        sent in the same message (command;*OPC?).
+
+        Args:
+            timeout_ms: I/O timeout for the wait; a large sample count at
+                        high NPLC needs more than the default
+                        (default: instrument timeout)
+            command: Optional command to send ahead of *OPC?
+
+        Raises:
+            RuntimeError: If not connected
+            pyvisa.errors.VisaIOError: If the operation does not finish in time
+
+        Example:
+            >>> dmm.set_sample_count(100)
+            >>> dmm.initiate()
+            >>> dmm.wait_complete(timeout_ms=30000)
+            >>> readings = dmm.fetch_array()
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        message = f"{command};*OPC?" if command else "*OPC?"
+
+        previous_timeout = self.instrument.timeout
+        if timeout_ms is not None:
+            self.instrument.timeout = timeout_ms
+        try:
+            self.query(message)
+        finally:
+            self.instrument.timeout = previous_timeout
+
     def fetch(self) -> float:
         """
         Fetch the last measurement result.
@@ -475,6 +744,61 @@ class A34405A:
         """
         return float(self.query(":FETC?"))
 
+    def fetch_array(self) -> np.ndarray:
+        """
+        Fetch all readings of the last acquisition as a numpy array.
+
+        Use after initiate() (and wait_complete()) when the sample or trigger
+        count is above 1. :FETC? returns every stored reading in one reply,
+        which the 1 MiB read chunk size receives in a single transfer even
+        for 50000 readings. The 34405A only returns ASCII readings; see
+        _parse_floats().
+
+        Returns:
+            Readings as a numpy array
+        """
+        return self._parse_floats(self.query(":FETC?"))
+
+    def measure_stream(self, count: int, func: str = 'dc_voltage',
+                       **config) -> np.ndarray:
+        """
+        Take a block of readings with one configuration and one :READ?.
+
+        The function is configured once (:CONF), the sample count is set to
+        count, and a single :READ? returns all readings. Unlike calling
+        measure_*() in a loop, the DMM does not reconfigure for every sample
+        and there is one query round trip for the whole block. The sample
+        count is set back to 1 afterwards so read() keeps returning one value.
+
+        The I/O timeout must cover the whole acquisition (count readings at
+        the configured NPLC).
+
+        Args:
+            count: Number of readings (1 to 50000)
+            func: Measurement function: 'dc_voltage', 'ac_voltage',
+                  'dc_current', 'ac_current', 'resistance',
+                  'resistance_4wire' or 'frequency' (default: 'dc_voltage')
+            **config: Passed to the matching configure_*() method
+                      (range_val, resolution, nplc, autozero, trigger_source)
+
+        Returns:
+            Readings as a numpy array
+
+        Example:
+            >>> volts = dmm.measure_stream(100, 'dc_voltage', nplc=0.2)
+        """
+        configure = getattr(self, f"configure_{func}", None)
+        if configure is None or func in ('continuity', 'diode'):
+            raise ValueError(f"Unsupported measurement function: {func}")
+
+        configure(**config)
+        self.set_sample_count(count)
+        try:
+            return self._parse_floats(self.query(":READ?"))
+        finally:
+            if count != 1:
+                self.set_sample_count(1)
+
     def set_trigger_source(self, source: str) -> None:
         """
         Set the trigger source.
@@ -483,18 +807,21 @@ class A34405A:
             source: Trigger source ('IMM', 'BUS', 'EXT')
         """
         source = source.upper()
-        if source not in ['IMM', 'BUS', 'EXT']:
+        if source not in self.TRIGGER_SOURCES:
             raise ValueError("Trigger source must be 'IMM', 'BUS', or 'EXT'")
         self.write(f":TRIG:SOUR {source}")
+        self._cache[":TRIG:SOUR"] = source
 
     def get_trigger_source(self) -> str:
         """
-        Get the trigger source.
+        Get the trigger source (cached after the first query or set).
 
         Returns:
             Current trigger source
         """
-        return self.query(":TRIG:SOUR?")
+        if ":TRIG:SOUR" not in self._cache:
+            self._cache[":TRIG:SOUR"] = self.query(":TRIG:SOUR?")
+        return self._cache[":TRIG:SOUR"]
 
     # ========== Sample and Trigger Count ==========
 
@@ -508,15 +835,18 @@ class A34405A:
         if not 1 <= count <= 50000:
             raise ValueError("Sample count must be between 1 and 50000")
         self.write(f":SAMP:COUN {count}")
+        self._cache[":SAMP:COUN"] = count
 
     def get_sample_count(self) -> int:
         """
-        Get the number of samples per trigger.
+        Get the number of samples per trigger (cached after the first query or set).
 
         Returns:
             Number of samples
         """
-        return int(self.query(":SAMP:COUN?"))
+        if ":SAMP:COUN" not in self._cache:
+            self._cache[":SAMP:COUN"] = int(self.query(":SAMP:COUN?"))
+        return self._cache[":SAMP:COUN"]
 
     def set_trigger_count(self, count: int) -> None:
         """
@@ -528,15 +858,18 @@ class A34405A:
         if not 1 <= count <= 50000:
             raise ValueError("Trigger count must be between 1 and 50000")
         self.write(f":TRIG:COUN {count}")
+        self._cache[":TRIG:COUN"] = count
 
     def get_trigger_count(self) -> int:
         """
-        Get the number of triggers.
+        Get the number of triggers (cached after the first query or set).
 
         Returns:
             Number of triggers
         """
-        return int(self.query(":TRIG:COUN?"))
+        if ":TRIG:COUN" not in self._cache:
+            self._cache[":TRIG:COUN"] = int(self.query(":TRIG:COUN?"))
+        return self._cache[":TRIG:COUN"]
 
     # ========== Display Control ==========
 
@@ -572,15 +905,18 @@ class A34405A:
         """
         state = "ON" if enable else "OFF"
         self.write(f":ZERO:AUTO {state}")
+        self._cache[":ZERO:AUTO"] = bool(enable)
 
     def get_autozero(self) -> bool:
         """
-        Get auto-zero state.
+        Get auto-zero state (cached after the first query or set).
 
         Returns:
             True if enabled, False if disabled
         """
-        return self.query(":ZERO:AUTO?") == "1"
+        if ":ZERO:AUTO" not in self._cache:
+            self._cache[":ZERO:AUTO"] = self.query(":ZERO:AUTO?") == "1"
+        return self._cache[":ZERO:AUTO"]
 
     def set_nplc(self, nplc: float) -> None:
         """
@@ -590,19 +926,21 @@ class A34405A:
             nplc: Number of power line cycles (0.02, 0.2, 1, 10, 100)
                   Higher NPLC = better resolution but slower
         """
-        valid_nplc = [0.02, 0.2, 1, 10, 100]
-        if nplc not in valid_nplc:
-            raise ValueError(f"NPLC must be one of {valid_nplc}")
+        if nplc not in self.VALID_NPLC:
+            raise ValueError(f"NPLC must be one of {list(self.VALID_NPLC)}")
         self.write(f":VOLT:DC:NPLC {nplc}")
+        self._cache[":VOLT:DC:NPLC"] = float(nplc)
 
     def get_nplc(self) -> float:
         """
-        Get the current NPLC setting.
+        Get the current NPLC setting (cached after the first query or set).
 
         Returns:
             Number of power line cycles
         """
-        return float(self.query(":VOLT:DC:NPLC?"))
+        if ":VOLT:DC:NPLC" not in self._cache:
+            self._cache[":VOLT:DC:NPLC"] = float(self.query(":VOLT:DC:NPLC?"))
+        return self._cache[":VOLT:DC:NPLC"]
 
     # ========== Utility Methods ==========
 
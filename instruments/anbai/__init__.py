@@ -4,6 +4,12 @@ Anbai (Applent) Instruments Package
 This package contains control modules for Anbai/Applent instruments.
 """
 
-from .at4516 import AT4516
-
 __all__ = ['AT4516']
+
+
+def __getattr__(name):
+    # Import the driver (and its backend library) on first use only
+    if name == 'AT4516':
+        from .at4516 import AT4516
+        return AT4516
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -70,6 +70,9 @@ class AT4516:
     # Sampling rates
     RATES = ['SLOW', 'MED', 'FAST']
 
+    # FETCH? query, encoded once for polling loops
+    FETCH_QUERY = b"FETCH?\n"
+
     # Temperature units
     UNITS = {
         'CEL': '°C',  # Celsius
@@ -181,6 +184,26 @@ class AT4516:
         Returns:
             Response string from the instrument
 
+        Raises:
+            RuntimeError: If not connected
+            TimeoutError: If no response received
+        """
+        # Send query
+        if not command.endswith('\n'):
+            command += '\n'
+
+        return self.query_raw(command.encode('ascii'))
+
+    def query_raw(self, data: bytes) -> str:
+        """
+        Send a pre-encoded query (including the trailing newline) and read the response.
+
+        Args:
+            data: Complete query as bytes (e.g. b"FETCH?\n")
+
+        Returns:
+            Response string from the instrument
+
         Raises:
             RuntimeError: If not connected
             TimeoutError: If no response received
@@ -191,11 +214,7 @@ class AT4516:
         # Clear input buffer before query
         self.serial_conn.reset_input_buffer()
 
-        # Send query
-        if not command.endswith('\n'):
-            command += '\n'
-
-        self.serial_conn.write(command.encode('ascii'))
+        self.serial_conn.write(data)
         self.serial_conn.flush()
 
         # Wait for instrument to process query (critical for AT4516)
@@ -203,16 +222,33 @@ class AT4516:
 
         # Read response (terminated by \n)
         try:
-            response = self.serial_conn.readline().decode('ascii').strip()
+            response = self._read_line().decode('ascii').strip()
             if not response:
-                raise TimeoutError(f"No response received for query: {command}")
+                raise TimeoutError(f"No response received for query: {data!r}")
 
             # Additional delay after receiving response
             time.sleep(self.inter_command_delay)
 
             return response
         except serial.SerialTimeoutException:
-            raise TimeoutError(f"Timeout waiting for response to: {command}")
+            raise TimeoutError(f"Timeout waiting for response to: {data!r}")
+
+    def _read_line(self) -> bytes:
+        """
+        Read one newline-terminated response.
+
+        Blocks for the first byte, then takes whatever is already buffered in
+        one read instead of pulling the line a byte at a time like readline().
+        Returns what was received so far if the serial timeout expires.
+        """
+        conn = self.serial_conn
+        line = bytearray()
+        while not line.endswith(b'\n'):
+            chunk = conn.read(conn.in_waiting or 1)
+            if not chunk:
+                break  # Timeout
+            line += chunk
+        return bytes(line)
 
     def identify(self) -> str:
         """
@@ -394,7 +430,7 @@ class AT4516:
             >>> print(temps)
             [23.4, 23.5, 23.3, None, None, None, None, None]
         """
-        response = self.query("FETCH?")
+        response = self.query_raw(self.FETCH_QUERY)
 
         # Parse response: "+2.34000e+01, +2.35000e+01, +2.33000e+01, ..."
         values = []
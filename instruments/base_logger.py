@@ -3,9 +3,9 @@ Base Data Logger Template
 
 This module provides a base class for real-time data logging with:
 - Precise timing compensation (not affected by processing time)
-- Buffered Excel output for performance
+- Buffered CSV output for performance (Excel file written once at the end)
 - Elapsed time tracking
-- Dual-file system (main + FINAL for viewing)
+- Dual-file system (main + FINAL CSV snapshot for viewing)
 - Graceful shutdown handling
 
 Inherit from this class to create instrument-specific loggers.
@@ -26,7 +26,10 @@ Example:
             return ["Timestamp", "Value", "Elapsed Time (ms)", "Elapsed Time (hr)"]
 """
 
+import os
 import sys
+import csv
+import shutil
 import time
 from datetime import datetime
 from pathlib import Path
@@ -34,8 +37,7 @@ from typing import Optional, List, Any
 from abc import ABC, abstractmethod
 import threading
 import signal
-
-from openpyxl import Workbook, load_workbook
+from concurrent.futures import ThreadPoolExecutor
 
 
 class BaseDataLogger(ABC):
@@ -51,28 +53,33 @@ class BaseDataLogger(ABC):
     """
 
     def __init__(self, results_dir: str = "results", save_interval: int = 50,
-                 measurement_interval: float = 0.1, final_copy_interval: float = 300):
+                 measurement_interval: float = 0.1, final_copy_interval: float = 300,
+                 display_interval: float = 0.5):
         """
         Initialize the data logger.
 
         Args:
             results_dir: Directory to save result files (default: "results")
-            save_interval: Number of measurements before saving to disk (default: 50)
+            save_interval: Number of measurements buffered before they are written to
+                the CSV data file (default: 50)
             measurement_interval: Time between measurements in seconds (default: 0.1 = 100ms)
             final_copy_interval: Time between FINAL file updates in seconds (default: 300 = 5min)
+            display_interval: Minimum time between console lines in seconds (default: 0.5);
+                every measurement is still logged, 0 prints each one
         """
         self.results_dir = Path(results_dir)
         self.save_interval = save_interval
         self.measurement_interval = measurement_interval
         self.final_copy_interval = final_copy_interval
+        self.display_interval = display_interval
 
-        self.workbook = None
-        self.worksheet = None
+        self.csv_file = None
+        self.csv_writer = None
+        self.csv_file_path = None
         self.main_file_path = None
         self.final_file_path = None
         self.running = False
         self.data_lock = threading.Lock()
-        self.row_index = 2
         self.start_time = None
         self.last_copy_time = None
         self.measurement_count = 0
@@ -167,33 +174,33 @@ class BaseDataLogger(ABC):
             return f"{timestamp_str} | {measurement} | {elapsed_ms:.1f} ms"
 
     def setup_excel_files(self) -> None:
-        """Create and initialize Excel files for data logging."""
+        """
+        Create the result files for data logging.
+
+        Rows stream to a CSV data file while logging (a plain buffered append);
+        the Excel file is built from it once, in close().
+        """
         self.start_time = datetime.now()
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
 
+        self.csv_file_path = self.results_dir / f"Result_{timestamp}.csv"
         self.main_file_path = self.results_dir / f"Result_{timestamp}.xlsx"
-        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.xlsx"
+        self.final_file_path = self.results_dir / f"Result_{timestamp}_FINAL.csv"
 
-        self.workbook = Workbook()
-        self.worksheet = self.workbook.active
-        self.worksheet.title = "Data"
+        # utf-8-sig so Excel detects the encoding when the CSV is opened directly
+        self.csv_file = open(self.csv_file_path, 'w', newline='', encoding='utf-8-sig',
+                             buffering=1 << 20)
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(self.get_headers())
 
-        # Write headers
-        headers = self.get_headers()
-        self.worksheet.append(headers)
-
-        # Set column widths
-        for i, header in enumerate(headers, 1):
-            col_letter = chr(64 + i)  # A, B, C, ...
-            self.worksheet.column_dimensions[col_letter].width = max(len(header) + 2, 15)
-
-        self.workbook.save(self.main_file_path)
         self.copy_to_final()
 
-        print(f"Created Excel files:")
-        print(f"  Main file: {self.main_file_path}")
+        print(f"Created result files:")
+        print(f"  Data file: {self.csv_file_path}")
+        print(f"  Main file: {self.main_file_path} (written when logging stops)")
         print(f"  FINAL file: {self.final_file_path}")
-        print(f"  Save interval: every {self.save_interval} measurements")
+        print(f"  Buffer size: {self.save_interval} measurements")
+        print(f"  FINAL update: every {self.final_copy_interval / 60:.1f} minutes")
 
     def buffer_data(self, row: List[Any]) -> None:
         """Add data to buffer and flush when full."""
@@ -205,34 +212,33 @@ class BaseDataLogger(ABC):
                 self.flush_buffer()
 
     def flush_buffer(self) -> None:
-        """Write buffered data to Excel file."""
+        """Write buffered rows to the CSV data file and hand them to the OS."""
         if not self.data_buffer:
             return
 
         try:
-            for row in self.data_buffer:
-                for col, value in enumerate(row, 1):
-                    self.worksheet.cell(row=self.row_index, column=col, value=value)
-                self.row_index += 1
-
-            self.workbook.save(self.main_file_path)
+            self.csv_writer.writerows(self.data_buffer)
             self.data_buffer.clear()
+            # Flush the 1 MB userspace buffer, so a crash or a closed console
+            # loses at most the rows not yet buffered
+            self.csv_file.flush()
 
         except Exception as e:
             print(f"Error flushing buffer: {e}")
 
     def copy_to_final(self) -> None:
-        """Copy the main file to the FINAL file."""
+        """Copy the CSV data file to the FINAL file."""
         try:
             with self.data_lock:
                 self.flush_buffer()
-                self.workbook.save(self.main_file_path)
+                # Also force the data file to disk at every FINAL update
+                os.fsync(self.csv_file.fileno())
 
-            wb_copy = load_workbook(self.main_file_path)
-            wb_copy.save(self.final_file_path)
-            wb_copy.close()
+            # The data file is complete on disk, a byte copy is all FINAL needs
+            # (done outside the lock so acquisition is not blocked on disk I/O)
+            shutil.copyfile(self.csv_file_path, self.final_file_path)
 
-            self.last_copy_time = time.time()
+            self.last_copy_time = time.monotonic()
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Updated FINAL file ({self.measurement_count} measurements)")
 
         except Exception as e:
@@ -247,57 +253,82 @@ class BaseDataLogger(ABC):
         print("="*60)
         print(f"Sampling interval: {interval_ms:.0f} ms (precise timing)")
         print(f"FINAL file update: {self.final_copy_interval / 60:.1f} minutes")
+        print(f"Console update: every {self.display_interval:g} s (all measurements are logged)")
         print(f"Press Ctrl+C to stop logging")
         print("="*60 + "\n")
 
         self.running = True
-        self.last_copy_time = time.time()
-
-        # Precise timing variables
-        next_measurement_time = time.time()
+        self.last_copy_time = time.monotonic()
+
+        # Precise timing: sample k is due at schedule_start + k * interval on the
+        # monotonic clock (immune to wall-clock jumps, no accumulated rounding)
+        schedule_start = time.monotonic()
+        k = 0
+
+        # Bind loop-invariant lookups once
+        start_time = self.start_time
+        interval = self.measurement_interval
+        final_copy_interval = self.final_copy_interval
+        read_measurement = self.read_measurement
+        format_measurement = self.format_measurement
+        format_display = self.format_display
+        buffer_data = self.buffer_data
+        _now = datetime.now
+        _sleep = time.sleep
+        _monotonic = time.monotonic
+        display_interval = self.display_interval
+        last_display = -display_interval
+
+        # FINAL updates (flush + file copy) run here, off the measurement loop;
+        # one worker so copies never overlap
+        copy_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="final-copy")
 
         try:
             while self.running:
                 # Get current time
-                now = datetime.now()
+                now = _now()
                 timestamp_str = now.strftime("%H:%M:%S") + f":{now.microsecond // 1000:03d}"
 
                 # Calculate elapsed time in milliseconds from start
-                elapsed_ms = (now - self.start_time).total_seconds() * 1000
+                elapsed_ms = (now - start_time).total_seconds() * 1000
 
                 # Read measurement
-                measurement = self.read_measurement()
+                measurement = read_measurement()
 
                 if measurement is not None:
                     # Format and buffer the data
-                    row = self.format_measurement(timestamp_str, elapsed_ms, measurement)
-                    self.buffer_data(row)
+                    row = format_measurement(timestamp_str, elapsed_ms, measurement)
+                    buffer_data(row)
 
-                    # Display to console
-                    display = self.format_display(timestamp_str, elapsed_ms, measurement)
-                    print(display)
+                    # Display to console (rate-limited, printing can stall on a slow terminal)
+                    if _monotonic() - last_display >= display_interval:
+                        last_display = _monotonic()
+                        print(format_display(timestamp_str, elapsed_ms, measurement))
 
                 # Check if it's time to update FINAL file
-                if time.time() - self.last_copy_time >= self.final_copy_interval:
-                    self.copy_to_final()
+                if _monotonic() - self.last_copy_time >= final_copy_interval:
+                    self.last_copy_time = _monotonic()
+                    copy_executor.submit(self.copy_to_final)
 
                 # Precise timing compensation
-                next_measurement_time += self.measurement_interval
-                sleep_time = next_measurement_time - time.time()
+                k += 1
+                sleep_time = schedule_start + k * interval - _monotonic()
 
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    _sleep(sleep_time)
                 else:
                     # Running behind schedule
-                    if sleep_time < -self.measurement_interval:
+                    if sleep_time < -interval:
                         print(f"Warning: Running {-sleep_time:.3f}s behind schedule")
-                        next_measurement_time = time.time()
+                        schedule_start = _monotonic()
+                        k = 0
 
         except KeyboardInterrupt:
             print("\n\nStopping data logging...")
             self.running = False
 
         finally:
+            copy_executor.shutdown(wait=True)
             print("Flushing buffered data...")
             with self.data_lock:
                 self.flush_buffer()
@@ -308,15 +339,84 @@ class BaseDataLogger(ABC):
             print(f"Total measurements: {self.measurement_count}")
 
     def close(self) -> None:
-        """Close all resources."""
-        if self.workbook:
-            with self.data_lock:
-                try:
-                    self.flush_buffer()
-                    self.workbook.save(self.main_file_path)
-                    self.workbook.close()
-                except Exception as e:
-                    print(f"Error closing workbook: {e}")
+        """Close the CSV data file and convert it to the Excel file."""
+        if self.csv_file is None:
+            return
+
+        with self.data_lock:
+            try:
+                self.flush_buffer()
+                self.csv_file.close()
+                self._write_workbook()
+                print(f"Saved Excel file: {self.main_file_path}")
+            except Exception as e:
+                print(f"Error writing Excel file: {e}")
+            finally:
+                self.csv_file = None
+                self.csv_writer = None
+
+    @staticmethod
+    def _parse_value(value: str) -> Any:
+        """Convert a CSV field back to a number where possible (empty -> None)."""
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    def _workbook_rows(self):
+        """Yield the header and data rows of the CSV data file, numbers restored."""
+        parse = self._parse_value
+        with open(self.csv_file_path, newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            yield next(reader)
+            for row in reader:
+                # Column 0 is the timestamp string
+                yield [row[0], *map(parse, row[1:])]
+
+    def _write_workbook(self) -> None:
+        """
+        Build the Excel file from the CSV data file in a single pass.
+
+        Uses xlsxwriter in constant_memory mode when it is installed (one row in
+        RAM at a time, faster than openpyxl), otherwise an openpyxl write-only workbook.
+        """
+        widths = [max(len(header) + 2, 15) for header in self.get_headers()]
+
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+
+        if xlsxwriter is not None:
+            workbook = xlsxwriter.Workbook(str(self.main_file_path), {'constant_memory': True})
+            worksheet = workbook.add_worksheet("Data")
+            for col, width in enumerate(widths):
+                worksheet.set_column(col, col, width)
+            write_row = worksheet.write_row
+            for row_index, values in enumerate(self._workbook_rows()):
+                write_row(row_index, 0, values)
+            workbook.close()
+            return
+
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Data")
+
+        # Set column widths (must be done before any row is appended)
+        for col, width in enumerate(widths, 1):
+            worksheet.column_dimensions[get_column_letter(col)].width = width
+
+        append = worksheet.append
+        for values in self._workbook_rows():
+            append(values)
+
+        # One large buffered handle instead of many small zip writes
+        with open(self.main_file_path, 'wb', buffering=1 << 20) as f:
+            workbook.save(f)
 
     def start(self) -> None:
         """
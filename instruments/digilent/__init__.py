@@ -4,6 +4,12 @@ Digilent Instruments Package
 This package provides Python modules for controlling Digilent instruments.
 """
 
-from .analog_discovery2 import AnalogDiscovery2
-
 __all__ = ['AnalogDiscovery2']
+
+
+def __getattr__(name):
+    # Import the driver (and its backend library) on first use only
+    if name == 'AnalogDiscovery2':
+        from .analog_discovery2 import AnalogDiscovery2
+        return AnalogDiscovery2
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,6 +24,8 @@ import sys
 import time
 from typing import Optional, Tuple
 
+import numpy as np
+
 # Load the DWF library
 if sys.platform == "win32":
     _dwf = ctypes.cdll.dwf
@@ -202,7 +204,8 @@ class AnalogDiscovery2:
 
         print(f"Analog input CH{channel+1} configured: Range ±{range_v/2}V, Offset {offset}V")
 
-    def read_analog_input(self, channel: int = 0, samples: int = 100) -> Optional[float]:
+    def read_analog_input(self, channel: int = 0, samples: int = 100,
+                          out: Optional[np.ndarray] = None) -> Optional[float]:
         """
         Read DC voltage from analog input channel.
 
@@ -211,15 +214,42 @@ class AnalogDiscovery2:
         Args:
             channel: Input channel (0 or 1)
             samples: Number of samples to average
+            out: Optional preallocated float64 buffer to reuse (see read_analog_samples)
 
         Returns:
             Average voltage in volts
         """
+        data = self.read_analog_samples(channel, samples, out=out)
+        if data is None:
+            return None
+        return float(data.mean())
+
+    def read_analog_samples(self, channel: int = 0, samples: int = 100,
+                            out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Acquire a block of raw samples from an analog input channel.
+
+        Args:
+            channel: Input channel (0 or 1)
+            samples: Number of samples to acquire
+            out: Optional preallocated contiguous float64 buffer of length samples;
+                 reused instead of allocating a new array on every call
+
+        Returns:
+            Numpy array of voltages (out if given), or None on acquisition timeout
+        """
         self._check_connected()
 
         if channel not in [0, 1]:
             raise ValueError("Channel must be 0 or 1")
 
+        if out is None:
+            data = np.empty(samples, dtype=np.float64)
+        elif out.dtype != np.float64 or out.size != samples or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a contiguous float64 array of {samples} samples")
+        else:
+            data = out
+
         # Set to single acquisition mode
         _dwf.FDwfAnalogInAcquisitionModeSet(self.hdwf, ctypes.c_int(0))  # acqmodeSingle
 
@@ -241,13 +271,11 @@ class AnalogDiscovery2:
             print(f"Warning: Acquisition timeout (status={sts.value})")
             return None
 
-        # Read samples
-        rg_samples = (ctypes.c_double * samples)()
-        _dwf.FDwfAnalogInStatusData(self.hdwf, ctypes.c_int(channel), rg_samples, ctypes.c_int(samples))
-
-        # Calculate average
-        avg = sum(rg_samples) / samples
-        return avg
+        # Read samples directly into the numpy buffer
+        _dwf.FDwfAnalogInStatusData(self.hdwf, ctypes.c_int(channel),
+                                    data.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                                    ctypes.c_int(samples))
+        return data
 
     def read_analog_input_fast(self, channel: int = 0) -> Optional[float]:
         """
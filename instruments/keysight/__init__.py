@@ -4,6 +4,12 @@ Keysight Instruments Module
 This module contains classes for controlling Keysight (formerly Agilent/HP) instruments.
 """
 
-from .dsox4034a import DSOX4034A
-
 __all__ = ["DSOX4034A"]
+
+
+def __getattr__(name):
+    # Import the driver (and its backend library) on first use only
+    if name == "DSOX4034A":
+        from .dsox4034a import DSOX4034A
+        return DSOX4034A
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
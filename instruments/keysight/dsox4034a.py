@@ -13,9 +13,11 @@ References:
 
 import pyvisa
 import numpy as np
-from typing import Optional, List, Tuple, Union
+from typing import Dict, Optional, List, Sequence, Tuple, Union
 import time
 
+from .. import get_resource_manager
+
 
 class DSOX4034A:
     """
@@ -58,7 +60,8 @@ class DSOX4034A:
     # Channel mapping
     CHANNELS = {1: "CHAN1", 2: "CHAN2", 3: "CHAN3", 4: "CHAN4"}
 
-    def __init__(self, resource_string: Optional[str] = None, timeout: int = 5000):
+    def __init__(self, resource_string: Optional[str] = None, timeout: int = 5000,
+                 chunk_size: Optional[int] = None, backend: Optional[str] = '@py'):
         """
         Initialize the DSOX4034A oscilloscope interface.
 
@@ -68,9 +71,13 @@ class DSOX4034A:
                 TCPIP format: "TCPIP0::192.168.1.100::INSTR"
                 If None, uses the lab's default instrument
             timeout: Command timeout in milliseconds (default: 5000)
+            chunk_size: VISA read chunk size in bytes (default: PyVISA default)
+            backend: PyVISA backend, see get_resource_manager() (default: '@py')
         """
         self.resource_string = resource_string or self.DEFAULT_RESOURCE
         self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.backend = backend
         self.instrument = None
         self._rm = None
 
@@ -82,10 +89,17 @@ class DSOX4034A:
             pyvisa.errors.VisaIOError: If connection fails
         """
         try:
-            self._rm = pyvisa.ResourceManager('@py')  # Use pyvisa-py backend
+            self._rm = get_resource_manager(self.backend)
             self.instrument = self._rm.open_resource(self.resource_string)
             self.instrument.timeout = self.timeout
 
+            # Responses end with a newline, so reads stop there without extra scans
+            self.instrument.read_termination = '\n'
+            self.instrument.write_termination = '\n'
+            self.instrument.query_delay = 0.0  # Read back immediately in query()
+            if self.chunk_size:
+                self.instrument.chunk_size = self.chunk_size
+
             # Clear status and reset error queue
             self.write("*CLS")
 
@@ -99,9 +113,8 @@ class DSOX4034A:
         if self.instrument:
             self.instrument.close()
             self.instrument = None
-        if self._rm:
-            self._rm.close()
-            self._rm = None
+        # The ResourceManager is shared with other instruments, leave it open
+        self._rm = None
         print("Disconnected from oscilloscope")
 
     def write(self, command: str) -> None:
@@ -135,7 +148,39 @@ class DSOX4034A:
             raise RuntimeError("Not connected to instrument. Call connect() first.")
         return self.instrument.query(command).strip()
 
-    def query_binary_values(self, command: str, datatype='B', container=list):
+    def write_raw(self, data: bytes) -> None:
+        """
+        Write pre-encoded bytes to the instrument.
+
+        Use this in tight loops with a command that is encoded once, including
+        the trailing newline (e.g. b":MEAS:VRMS? CHAN1\\n").
+
+        Args:
+            data: Complete message as bytes
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        self.instrument.write_raw(data)
+
+    def read_raw(self) -> bytes:
+        """
+        Read a raw response from the instrument.
+
+        Returns:
+            Response bytes (including the termination character)
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        return self.instrument.read_raw()
+
+    def query_binary_values(self, command: str, datatype='B', container=list,
+                            is_big_endian: bool = False):
         """
         Query binary data from the instrument.
 
@@ -143,13 +188,40 @@ class DSOX4034A:
             command: SCPI query command
             datatype: Data type format (default: 'B' for unsigned byte)
             container: Container type for returned data (default: list)
+            is_big_endian: Byte order of multi-byte samples (default: False,
+                           matching :WAV:BYT LSBF)
 
         Returns:
             Binary data in specified container format
         """
         if not self.instrument:
             raise RuntimeError("Not connected to instrument. Call connect() first.")
-        return self.instrument.query_binary_values(command, datatype=datatype, container=container)
+        return self.instrument.query_binary_values(command, datatype=datatype, container=container,
+                                                   is_big_endian=is_big_endian)
+
+    def query_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several queries in one SCPI message and split the responses.
+
+        The queries are joined with ';:' so the scope answers them all in a
+        single round trip instead of one per query.
+
+        Args:
+            commands: List of SCPI query commands (e.g. [':TIM:SCAL?', ':TIM:POS?'])
+
+        Returns:
+            List of response strings, one per command
+
+        Raises:
+            RuntimeError: If not connected or the response count does not match
+        """
+        message = ";:".join(command.lstrip(":") for command in commands)
+        responses = self.query(f":{message}").split(";")
+        if len(responses) != len(commands):
+            raise RuntimeError(
+                f"Expected {len(commands)} responses, got {len(responses)}: {responses}"
+            )
+        return [response.strip() for response in responses]
 
     # ========== Instrument Identification ==========
 
@@ -199,19 +271,63 @@ class DSOX4034A:
         """Set oscilloscope to single trigger mode."""
         self.write(":SING")
 
-    def digitize(self, channels: Optional[List[int]] = None) -> None:
+    def digitize(self, channels: Optional[List[int]] = None, wait: bool = False,
+                 timeout_ms: Optional[int] = None) -> None:
         """
         Acquire waveform data (similar to pressing Single button).
 
         Args:
             channels: List of channel numbers to digitize (e.g., [1, 2])
                      If None, digitizes all active channels
+            wait: If True, block until the acquisition is complete by sending
+                  ':DIG ...;*OPC?' as one message (see wait_complete())
+            timeout_ms: I/O timeout used for the wait (default: instrument timeout)
         """
         if channels:
             chan_str = ",".join([self.CHANNELS[ch] for ch in channels])
-            self.write(f":DIG {chan_str}")
+            command = f":DIG {chan_str}"
         else:
-            self.write(":DIG")
+            command = ":DIG"
+
+        if wait:
+            self.wait_complete(timeout_ms, command=command)
+        else:
+            self.write(command)
+
+    def wait_complete(self, timeout_ms: Optional[int] = None,
+                      command: Optional[str] = None) -> None:
+        """
+        Block until all pending operations are complete using *OPC?.
+
+        The scope answers *OPC? only after the preceding sequential command
+        (e.g. :DIGitize) has finished, so this is a single blocking wait at a
+        known sync point. When command is given it is sent in the same
+        message (command;*OPC?) so both are handled by the same parser thread.
+
+        Note: :SINGle returns as soon as the scope is armed, so *OPC? after
+        single() does not wait for the trigger. Use digitize(wait=True) when
+        the waveform must be complete before reading it.
+
+        Args:
+            timeout_ms: I/O timeout for the wait; long timebases need more than
+                        the default (default: instrument timeout)
+            command: Optional command to send ahead of *OPC?
+
+        Raises:
+            RuntimeError: If not connected
+            pyvisa.errors.VisaIOError: If the operation does not finish in time
+        """
+        if not self.instrument:
+            raise RuntimeError("Not connected to instrument. Call connect() first.")
+        message = f"{command};*OPC?" if command else "*OPC?"
+
+        previous_timeout = self.instrument.timeout
+        if timeout_ms is not None:
+            self.instrument.timeout = timeout_ms
+        try:
+            self.instrument.query(message, delay=0)
+        finally:
+            self.instrument.timeout = previous_timeout
 
     # ========== Channel Configuration ==========
 
@@ -324,6 +440,26 @@ class DSOX4034A:
         self._validate_channel(channel)
         return self.query(f":{self.CHANNELS[channel]}:COUP?")
 
+    def get_channel_settings(self, channel: int) -> dict:
+        """
+        Read back scale, offset and coupling of a channel in one round trip.
+
+        Values come from the scope (not a local copy), so any coercion the
+        instrument applied to a setting is reflected.
+
+        Args:
+            channel: Channel number (1-4)
+
+        Returns:
+            Dictionary with 'scale' (V/div), 'offset' (V) and 'coupling' ('AC' or 'DC')
+        """
+        self._validate_channel(channel)
+        ch = self.CHANNELS[channel]
+        scale, offset, coupling = self.query_batch(
+            [f":{ch}:SCAL?", f":{ch}:OFFS?", f":{ch}:COUP?"]
+        )
+        return {'scale': float(scale), 'offset': float(offset), 'coupling': coupling}
+
     # ========== Timebase Configuration ==========
 
     def set_timebase_scale(self, scale: float) -> None:
@@ -577,36 +713,102 @@ class DSOX4034A:
             'yreference': int(preamble[9])
         }
 
-    def get_waveform(self, channel: int, points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    def get_waveform(self, channel: int, points: int = 1000,
+                     format: str = 'BYTE') -> Tuple[np.ndarray, np.ndarray]:
         """
         Acquire waveform data from a channel.
 
+        Data is always transferred as a binary block. BYTE gives 8-bit
+        samples (smallest transfer); WORD gives 16-bit samples with full
+        vertical resolution, sent LSB first as unsigned values.
+
         Args:
             channel: Channel number (1-4)
             points: Number of points to acquire (default: 1000)
+            format: Transfer format ('BYTE' or 'WORD', default: 'BYTE')
 
         Returns:
             Tuple of (time_array, voltage_array) as numpy arrays
         """
         self._validate_channel(channel)
 
-        # Configure waveform acquisition
+        # Configure waveform acquisition (source first, the valid points
+        # modes depend on it)
         self.set_waveform_source(channel)
-        self.set_waveform_format('BYTE')
+        format = self._configure_waveform_transfer(points, format)
+        return self._read_waveform(format)
+
+    def get_waveforms(self, channels: Sequence[int], points: int = 1000,
+                      format: str = 'BYTE') -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Acquire waveform data from several channels.
+
+        The transfer format and point count are configured once; each channel
+        then costs only a source change, a preamble query and the data block.
+        The preamble cannot be shared between channels: its y increment, origin
+        and reference follow each channel's vertical scale and offset.
+        Transfers stay sequential: :WAVeform:SOURce is global scope state, so
+        overlapping reads (even over separate sessions) would mix up channels.
+
+        Args:
+            channels: Channel numbers (1-4)
+            points: Number of points to acquire per channel (default: 1000)
+            format: Transfer format ('BYTE' or 'WORD', default: 'BYTE')
+
+        Returns:
+            Dictionary mapping channel number to (time_array, voltage_array)
+        """
+        for channel in channels:
+            self._validate_channel(channel)
+        if not channels:
+            return {}
+
+        self.set_waveform_source(channels[0])
+        format = self._configure_waveform_transfer(points, format)
+
+        waveforms = {}
+        for i, channel in enumerate(channels):
+            if i:
+                self.set_waveform_source(channel)
+            waveforms[channel] = self._read_waveform(format)
+        return waveforms
+
+    def _configure_waveform_transfer(self, points: int, format: str) -> str:
+        """Set the waveform transfer format and point count; return the format."""
+        format = format.upper()
+        if format not in ['BYTE', 'WORD']:
+            raise ValueError("Format must be 'BYTE' or 'WORD'")
+
+        self.set_waveform_format(format)
+        if format == 'WORD':
+            self.write(":WAV:BYT LSBF")
+            self.write(":WAV:UNS ON")
         self.set_waveform_points_mode('NORM')
         self.set_waveform_points(points)
+        return format
 
+    def _read_waveform(self, format: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Read the preamble and data block of the current waveform source."""
         # Get preamble for scaling
         preamble = self.get_waveform_preamble()
 
-        # Get waveform data
-        raw_data = self.query_binary_values(":WAV:DATA?", datatype='B', container=np.array)
+        # Get waveform data; with a NumPy container PyVISA wraps the block
+        # with np.frombuffer, so no per-sample parsing happens in Python
+        datatype = 'H' if format == 'WORD' else 'B'
+        raw_data = self.query_binary_values(":WAV:DATA?", datatype=datatype, container=np.array,
+                                            is_big_endian=False)
 
-        # Convert to voltage
-        voltage = (raw_data - preamble['yreference']) * preamble['yincrement'] + preamble['yorigin']
+        # Convert to voltage (as float, unsigned samples would wrap on subtraction);
+        # scaled in place so the one float buffer is the only allocation
+        voltage = raw_data.astype(np.float64)
+        voltage -= preamble['yreference']
+        voltage *= preamble['yincrement']
+        voltage += preamble['yorigin']
 
         # Create time array
-        time = np.arange(preamble['points']) * preamble['xincrement'] + preamble['xorigin']
+        time = np.arange(preamble['points'], dtype=np.float64)
+        time *= preamble['xincrement']
+        time += preamble['xorigin']
 
         return time, voltage
 
@@ -716,6 +918,26 @@ class DSOX4034A:
         self._validate_channel(channel)
         return float(self.query(f":MEAS:DUT? {self.CHANNELS[channel]}"))
 
+    def measure_multi(self, channel: int,
+                      measurements: Sequence[str] = ('VRMS', 'VPP', 'FREQ')) -> Tuple[float, ...]:
+        """
+        Take several measurements on one channel in a single round trip.
+
+        Args:
+            channel: Channel number (1-4)
+            measurements: :MEASure keywords (e.g. 'VRMS', 'VPP', 'VMAX', 'FREQ')
+
+        Returns:
+            Tuple of values in the same order as measurements
+
+        Example:
+            >>> vrms, vpp = scope.measure_multi(1, ('VRMS', 'VPP'))
+        """
+        self._validate_channel(channel)
+        source = self.CHANNELS[channel]
+        responses = self.query_batch([f":MEAS:{m.upper()}? {source}" for m in measurements])
+        return tuple(float(response) for response in responses)
+
     # ========== Utility Methods ==========
 
     def _validate_channel(self, channel: int) -> None: